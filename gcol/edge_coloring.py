@@ -1,15 +1,16 @@
 """Edge coloring functions."""
 
 import networkx as nx
-import random
-from .node_coloring import equitable_node_k_coloring, node_k_coloring, _greedy
-from .node_coloring import _rlf, _dsatur, _getEdgeWeights, _getNodeWeights
+from .node_coloring import equitable_node_k_coloring, node_k_coloring
+from .node_coloring import _initialcoloring, _getEdgeWeights, _getNodeWeights
 from .node_coloring import _reducecolors, _backtrackcol, node_precoloring
-from .node_coloring import _check_params, node_list_coloring
+from .node_coloring import _check_params, node_list_coloring, _CSRGraph
+from .node_coloring import _getdeadline
 
 
 def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
-                              verbose=0):
+                              verbose=0, time_limit=None, n_jobs=1,
+                              eq_alg=1):
     r"""Attempt to color the edges of a graph using ``k`` colors.
 
     This is done so that (a) adjacent edges have different colors, and (b) the
@@ -58,7 +59,9 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
           The algorithm halts only when the existence of an edge $k$-coloring
-          has been proved or disproved.
+          has been proved or disproved, or when ``time_limit`` expires
+          (in which case a ``ValueError`` is raised if no $k$-coloring
+          has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in $L(G)$ to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$
@@ -81,12 +84,44 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
     it_limit : int, optional (default=0)
         Number of iterations of the local search procedure. Not applicable
-        when using ``opt_alg=1``.
+        when using ``opt_alg=1``. If ``eq_alg=2``, this is also the number of
+        iterations of the tabu search used to balance the color classes.
 
     verbose : int, optional (default=0)
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
+    eq_alg : int, optional (default=1)
+        An integer specifying the method used to reduce the standard deviation
+        in weights across the $k$ color classes, once a $k$-coloring has been
+        found. It must be one of the following
+
+        * ``1`` : A steepest descent algorithm that halts at the first local
+          optimum.
+        * ``2`` : A tabu search algorithm that also performs moves that worsen
+          the balance, allowing it to escape from local optima. It halts after
+          ``it_limit`` iterations. Each iteration has a complexity
+          $O(n + m + k^2)$, where $n$ and $m$ are the number of nodes and
+          edges in $L(G)$.
+
+        Both algorithms also halt when ``time_limit`` is reached, or when no
+        further improvement in the balance is possible. Further details are
+        given in the notes section of the
+        :meth:`equitable_node_k_coloring` method.
+
     Returns
     -------
     dict
@@ -141,6 +176,12 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
+        If ``eq_alg`` is not among the supported options.
+
         If ``k`` is not a nonnegative integer.
 
         If a clique larger than ``k`` is observed in the line graph of $G$.
@@ -161,11 +202,11 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
     steps as the :meth:`node_k_coloring` method to try and find a node
     $k$-coloring of $L(G)$; however, it also takes edge weights into account
     if needed. If an edge $k$-coloring is achieved, a bespoke local search
-    operator (based on steepest descent) is then used to try to reduce the
-    standard deviation in weights across the $k$ color classes. This follows
-    the same steps as the :meth:`equitable_node_k_coloring` method, using
-    $L(G)$. Further details on this optimization method can be found in Chapter
-    7 of [2]_, or in [3]_.
+    operator (based on steepest descent or, if ``eq_alg=2``, tabu search) is
+    then used to try to reduce the standard deviation in weights across the
+    $k$ color classes. This follows the same steps as the
+    :meth:`equitable_node_k_coloring` method, using $L(G)$. Further details on
+    this optimization method can be found in Chapter 7 of [2]_, or in [3]_.
 
     All the above algorithms are described in detail in [2]_. The c++ code used
     in [2]_ and [4]_ forms the basis of this library's Python implementations.
@@ -191,7 +232,8 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, "dsatur", opt_alg, it_limit, verbose)
+    _check_params(G, "dsatur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs, eq_alg)
     if k < 0:
         raise ValueError("Error, nonnegative integer needed for k")
     if len(G) == 0 or G.number_of_edges() == 0:
@@ -206,11 +248,12 @@ def equitable_edge_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
     H.add_nodes_from((v, G.edges[v]) for v in H)
     return equitable_node_k_coloring(
         H, k, weight=weight, opt_alg=opt_alg, it_limit=it_limit,
-        verbose=verbose
+        verbose=verbose, time_limit=time_limit, n_jobs=n_jobs, eq_alg=eq_alg
     )
 
 
-def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
+def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0,
+                    time_limit=None, n_jobs=1):
     r"""Attempt to color the edges of a graph ``G`` using ``k`` colors.
 
     This is done so that adjacent edges have different colors (a pair of edges
@@ -261,7 +304,9 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
           The algorithm halts only when the existence of an edge $k$-coloring
-          has been proved or disproved.
+          has been proved or disproved, or when ``time_limit`` expires
+          (in which case a ``ValueError`` is raised if no $k$-coloring
+          has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in $L(G)$ to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$
@@ -290,6 +335,19 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -305,11 +363,11 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
     >>> G = nx.dodecahedral_graph()
     >>> c = gcol.edge_k_coloring(G, 4)
     >>> print(c)
-    {(11, 12): 0, (11, 18): 1, (10, 11): 2, ..., (6, 7): 2}
+    {(11, 12): 0, (11, 18): 1, (18, 19): 0, ..., (15, 16): 1}
     >>>
     >>> c = gcol.edge_k_coloring(G, 3)
     >>> print(c)
-    {(11, 12): 0, (11, 18): 1, (10, 11): 2, ..., (7, 8): 0}
+    {(11, 12): 0, (11, 18): 1, (18, 19): 0, ..., (15, 16): 2}
 
     Raises
     ------
@@ -325,6 +383,10 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``k`` is not a nonnegative integer.
 
         If a clique larger than ``k`` is observed in the line graph of $G$.
@@ -362,7 +424,8 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, "dsatur", opt_alg, it_limit, verbose)
+    _check_params(G, "dsatur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if k < 0:
         raise ValueError("Error, positive integer needed for k")
     if len(G) == 0 or G.number_of_edges() == 0:
@@ -375,11 +438,13 @@ def edge_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
         )
     H = nx.line_graph(G)
     return node_k_coloring(
-        H, k, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose
+        H, k, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose,
+        time_limit=time_limit, n_jobs=n_jobs
     )
 
 
-def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
+def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0,
+                  time_limit=None, n_jobs=1):
     r"""Return a coloring of a graph's edges.
 
     An edge coloring of a graph is an assignment of colors to edges so that
@@ -424,17 +489,31 @@ def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
           greedy algorithm for graph node coloring [2]_.
         * ``'welsh-powell'`` : Orders $L(G)$'s nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from $L(G)$ to form a smallest-last ordering, then applies the greedy
+          algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of
+          $L(G)$, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring
           on $L(G)$ [3]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on $L(G)$ [4]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to $L(G)$, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to try
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in $L(G)$ to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$
@@ -463,6 +542,20 @@ def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        ``'portfolio'`` strategy and the subsequent optimization process.
+        When this limit is reached, the best solution found so far is used,
+        even if ``it_limit`` has not been reached. If ``None``, no limit is
+        applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -479,14 +572,14 @@ def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
     >>> G = nx.dodecahedral_graph()
     >>> c = gcol.edge_coloring(G)
     >>> print("Coloring is", c)
-    Coloring is {(11, 12): 0, (11, 18): 1, ..., (7, 8): 0}
+    Coloring is {(11, 12): 0, (11, 18): 1, ..., (15, 16): 2}
     >>>
     >>> print("Number of colors =", max(c.values()) + 1)
     Number of colors = 3
     >>>
     >>> c = gcol.edge_coloring(G, strategy="rlf", opt_alg=2, it_limit=1000)
     >>> print("Coloring is", c)
-    Coloring is {(3, 4): 0, (17, 18): 0, ..., (7, 14): 2}
+    Coloring is {(11, 12): 0, (11, 18): 1, ..., (15, 16): 2}
     >>>
     >>> print("Number of colors =", max(c.values()) + 1)
     Number of colors = 3
@@ -507,6 +600,10 @@ def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
     Notes
     -----
     As mentioned, in this implementation, edge colorings of a graph $G$ are
@@ -540,34 +637,29 @@ def edge_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
+    deadline = _getdeadline(time_limit)
     if len(G) == 0 or G.number_of_edges() == 0:
         return {}
     # Now simply color the nodes of the line graph H of G
     maxdeg = max(d for v, d in G.degree())
     H = nx.line_graph(G)
-    if strategy == "random":
-        V = list(H)
-        random.shuffle(V)
-        c = _greedy(H, V)
-    elif strategy == "welsh_powell":
-        V = sorted(H, key=H.degree, reverse=True)
-        c = _greedy(H, V)
-    elif strategy == "rlf":
-        c = _rlf(H)
-    else:
-        c = _dsatur(H)
+    A = _CSRGraph(H)
+    c = _initialcoloring(A, strategy, deadline)
     # If selected, employ the chosen optimisation method
     if opt_alg is None:
-        return c
+        return A.to_labels(c)
     if opt_alg in [2, 4]:
         W = _getEdgeWeights(H, None)
     else:
         W = _getNodeWeights(H, None)
     cliqueNum = nx.approximation.large_clique_size(H)
-    return _reducecolors(
-        H, c, max(cliqueNum, maxdeg), W, opt_alg, it_limit, verbose
+    c, its = _reducecolors(
+        A, c, max(cliqueNum, maxdeg), W, opt_alg, it_limit, verbose,
+        deadline, n_jobs
     )
+    return A.to_labels(c)
 
 
 def chromatic_index(G):
@@ -654,12 +746,13 @@ def chromatic_index(G):
     maxdeg = max(d for v, d in G.degree())
     H = nx.line_graph(G)
     cliqueNum = nx.approximation.large_clique_size(H)
-    c = _backtrackcol(H, max(cliqueNum, maxdeg), 0)
-    return max(c.values()) + 1
+    c = _backtrackcol(_CSRGraph(H), max(cliqueNum, maxdeg), 0)
+    return max(c) + 1
 
 
 def edge_precoloring(
-    G, precol=None, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0
+    G, precol=None, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0,
+    time_limit=None, n_jobs=1
 ):
     r"""Return a coloring of a graph's edges where some edges are precolored.
 
@@ -701,17 +794,31 @@ def edge_precoloring(
           greedy algorithm for graph node coloring [1]_.
         * ``'welsh-powell'`` : Orders $L(G)$'s nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from $L(G)$ to form a smallest-last ordering, then applies the greedy
+          algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of
+          $L(G)$, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           $L(G)$ [2]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on $L(G)$ [3]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to $L(G)$, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to try
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in $L(G)$ to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -740,6 +847,19 @@ def edge_precoloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -756,7 +876,7 @@ def edge_precoloring(
     >>> p = {(0, 1):0, (8, 9): 1, (10, 11): 2, (11, 12): 3}
     >>> c = gcol.edge_precoloring(G, precol=p)
     >>> print("Coloring is",c)
-    Coloring is {(0, 1): 0, (8, 9): 1, ..., (5, 6): 2}
+    Coloring is {(0, 1): 0, (8, 9): 1, ..., (15, 16): 2}
 
     Raises
     ------
@@ -774,6 +894,10 @@ def edge_precoloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``precol`` contains an edge that is not in ``G``.
 
         If ``precol`` contains a color label that is not a nonnegative integer.
@@ -812,13 +936,14 @@ def edge_precoloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0 or G.number_of_edges() == 0:
         return {}
     if precol is None or precol == {}:
         return edge_coloring(
             G, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(precol, dict):
         raise TypeError(
@@ -866,7 +991,8 @@ def edge_precoloring(
             edge_precol[u, v] = precol[v, u]
     return node_precoloring(
         H, precol=edge_precol, strategy=strategy, opt_alg=opt_alg,
-        it_limit=it_limit, verbose=verbose
+        it_limit=it_limit, verbose=verbose, time_limit=time_limit,
+        n_jobs=n_jobs
     )
 
 
@@ -876,7 +1002,9 @@ def edge_list_coloring(
     strategy="dsatur",
     opt_alg=None,
     it_limit=0,
-    verbose=0
+    verbose=0,
+    time_limit=None,
+    n_jobs=1
 ):
     r"""Return a solution to the edge list coloring problem on ``G``.
 
@@ -925,16 +1053,30 @@ def edge_list_coloring(
           greedy algorithm for graph node coloring [1]_.
         * ``'welsh-powell'`` : Orders $L(G)$'s nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from $L(G)$ to form a smallest-last ordering, then applies the greedy
+          algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of
+          $L(G)$, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           $L(G)$ [2]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on $L(G)$ [3]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to $L(G)$, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used.
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in $L(G)$ to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -963,6 +1105,19 @@ def edge_list_coloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -997,6 +1152,10 @@ def edge_list_coloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``allowed_cols`` has an edge not in G, or is missing an entry for an
         edge in ``G``.
 
@@ -1043,13 +1202,14 @@ def edge_list_coloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0 or G.number_of_edges() == 0:
         return {}
     if allowed_cols is None or len(allowed_cols) == 0:
         return edge_coloring(
             G, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(allowed_cols, dict):
         raise TypeError(
@@ -1084,7 +1244,8 @@ def edge_list_coloring(
             edge_allowed_cols[u, v] = allowed_cols[v, u]
     return node_list_coloring(
         H, allowed_cols=edge_allowed_cols, strategy=strategy, opt_alg=opt_alg,
-        it_limit=it_limit, verbose=verbose
+        it_limit=it_limit, verbose=verbose, time_limit=time_limit,
+        n_jobs=n_jobs
     )
 
 
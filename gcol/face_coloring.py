@@ -4,6 +4,7 @@ import networkx as nx
 import math
 import itertools
 from .node_coloring import node_k_coloring, node_coloring, _backtrackcol
+from .node_coloring import _CSRGraph
 from .node_coloring import equitable_node_k_coloring, node_precoloring
 from .node_coloring import _check_params, node_list_coloring
 
@@ -309,7 +310,7 @@ def dual_graph(G, pos):
 
 
 def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
-                  verbose=0):
+                  verbose=0, time_limit=None, n_jobs=1):
     r"""Return a coloring of a planar graph's faces.
 
     A face coloring is an assignment of colors to the faces of a graph's planar
@@ -346,17 +347,31 @@ def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
           greedy algorithm for graph node coloring [2]_.
         * ``'welsh-powell'`` : Orders the dual's nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the dual to form a smallest-last ordering, then applies the
+          greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          dual, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           the dual [3]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on the dual [4]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to the dual, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to try
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in the dual to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -385,6 +400,19 @@ def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -429,6 +457,10 @@ def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``pos`` has missing or invalid entries.
 
         If ``pos`` does not specify a valid planar embedding of ``G``.
@@ -467,7 +499,8 @@ def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0:
         return {}
     # Color the nodes of the dual graph H of the emedding defined by G and pos
@@ -476,7 +509,8 @@ def face_coloring(G, pos, strategy="dsatur", opt_alg=None, it_limit=0,
         H, strategy=strategy,
         opt_alg=opt_alg,
         it_limit=it_limit,
-        verbose=verbose
+        verbose=verbose,
+        time_limit=time_limit, n_jobs=n_jobs
     )
     # Return the face coloring of G.
     return {tuple(faces[i]): c[i] for i in range(len(H))}
@@ -565,11 +599,12 @@ def face_chromatic_number(G):
         return 0
     H, faces = dual_graph(G, nx.planar_layout(G))
     cliqueNum = nx.approximation.large_clique_size(H)
-    c = _backtrackcol(H, cliqueNum, 0)
-    return max(c.values()) + 1
+    c = _backtrackcol(_CSRGraph(H), cliqueNum, 0)
+    return max(c) + 1
 
 
-def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
+def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0,
+                    time_limit=None, n_jobs=1):
     r"""Attempt to color the faces of a planar graph ``G`` using ``k`` colors.
 
     This is done so that adjacent faces have different colors (a pair of faces
@@ -606,7 +641,9 @@ def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (in which case a ``ValueError`` is
+          raised if no $k$-coloring has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in the dual to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -635,6 +672,19 @@ def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -677,6 +727,10 @@ def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``pos`` has missing or invalid entries.
 
         If ``pos`` does not specify a valid planar embedding of ``G``.
@@ -717,19 +771,22 @@ def face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, "dstaur", opt_alg, it_limit, verbose)
+    _check_params(G, "dstaur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if k < 0:
         raise ValueError("Error, positive integer needed for k")
     if len(G) == 0:
         return {}
     H, faces = dual_graph(G, pos)
     c = node_k_coloring(
-        H, k, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose
+        H, k, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose,
+        time_limit=time_limit, n_jobs=n_jobs
     )
     return {tuple(faces[i]): c[i] for i in range(len(H))}
 
 
-def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
+def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0,
+                              time_limit=None, n_jobs=1, eq_alg=1):
     r"""Attempt to color the faces of a planar graph ``G`` using ``k`` colors.
 
     This is done so that (a) adjacent faces have different colors, and (b) the
@@ -770,7 +827,9 @@ def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (in which case a ``ValueError`` is
+          raised if no $k$-coloring has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in the dual to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -793,12 +852,44 @@ def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
 
     it_limit : int, optional (default=0)
         Number of iterations of the local search procedure. Not applicable
-        when using ``opt_alg=1``.
+        when using ``opt_alg=1``. If ``eq_alg=2``, this is also the number of
+        iterations of the tabu search used to balance the color classes.
 
     verbose : int, optional (default=0)
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
+    eq_alg : int, optional (default=1)
+        An integer specifying the method used to reduce the standard deviation
+        in sizes across the $k$ color classes, once a $k$-coloring has been
+        found. It must be one of the following
+
+        * ``1`` : A steepest descent algorithm that halts at the first local
+          optimum.
+        * ``2`` : A tabu search algorithm that also performs moves that worsen
+          the balance, allowing it to escape from local optima. It halts after
+          ``it_limit`` iterations. Each iteration has a complexity
+          $O(n + m + k^2)$, where $n$ and $m$ are the number of nodes and
+          edges in the dual.
+
+        Both algorithms also halt when ``time_limit`` is reached, or when no
+        further improvement in the balance is possible. Further details are
+        given in the notes section of the
+        :meth:`equitable_node_k_coloring` method.
+
     Returns
     -------
     dict
@@ -841,6 +932,12 @@ def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
+        If ``eq_alg`` is not among the supported options.
+
         If ``pos`` has missing or invalid entries.
 
         If ``pos`` does not specify a valid planar embedding of ``G``.
@@ -858,8 +955,9 @@ def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
     As mentioned, in this implementation face colorings of a graph $G$ are
     determined by forming its dual and then passing this to the
     :meth:`node_k_coloring` method. If a face $k$-coloring is achieved, a
-    bespoke local search operator (based on steepest descent) is then used to
-    try to reduce the standard deviation in sizes across the $k$ color classes.
+    bespoke local search operator (based on steepest descent or, if
+    ``eq_alg=2``, tabu search) is then used to try to reduce the standard
+    deviation in sizes across the $k$ color classes.
     This follows the same steps as the :meth:`equitable_node_k_coloring`
     method, using the dual of ``G``. Further details on this optimization
     method can be found in Chapter 7 of [2]_.
@@ -884,20 +982,23 @@ def equitable_face_k_coloring(G, pos, k, opt_alg=None, it_limit=0, verbose=0):
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, "dsatur", opt_alg, it_limit, verbose)
+    _check_params(G, "dsatur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs, eq_alg)
     if k < 0:
         raise ValueError("Error, nonnegative integer needed for k")
     if len(G) == 0:
         return {}
     H, faces = dual_graph(G, pos)
     c = equitable_node_k_coloring(
-        H, k, weight=None, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose
+        H, k, weight=None, opt_alg=opt_alg, it_limit=it_limit, verbose=verbose,
+        time_limit=time_limit, n_jobs=n_jobs, eq_alg=eq_alg
     )
     return {tuple(faces[i]): c[i] for i in range(len(H))}
 
 
 def face_precoloring(
-    G, pos, precol=None, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0
+    G, pos, precol=None, strategy="dsatur", opt_alg=None, it_limit=0,
+    verbose=0, time_limit=None, n_jobs=1
 ):
     r"""Give a face coloring of a planar graph where some faces are precolored.
 
@@ -944,17 +1045,31 @@ def face_precoloring(
           greedy algorithm for graph node coloring [1]_.
         * ``'welsh-powell'`` : Orders the dual's nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the dual to form a smallest-last ordering, then applies the
+          greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          dual, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           the dual [2]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on the dual [3]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to the dual, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to try
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in the dual to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -983,6 +1098,19 @@ def face_precoloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -1027,6 +1155,10 @@ def face_precoloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``precol`` contains a face that is not in the embedding of ``G``.
 
         If ``precol`` contains a color label that is not a nonnegative integer.
@@ -1074,13 +1206,14 @@ def face_precoloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0:
         return {}
     if precol is None or precol == {}:
         return face_coloring(
             G, pos, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(precol, dict):
         raise TypeError(
@@ -1106,7 +1239,7 @@ def face_precoloring(
          for i in range(len(faces)) if faces[i] in precol_canon}
     c = node_precoloring(
         H, P, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-        verbose=verbose
+        verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
     )
     return {tuple(faces[i]): c[i] for i in range(len(H))}
 
@@ -1118,7 +1251,9 @@ def face_list_coloring(
     strategy="dsatur",
     opt_alg=None,
     it_limit=0,
-    verbose=0
+    verbose=0,
+    time_limit=None,
+    n_jobs=1
 ):
     r"""Return a solution to the face list coloring problem on ``G``.
 
@@ -1171,16 +1306,30 @@ def face_list_coloring(
           greedy algorithm for graph node coloring [1]_.
         * ``'welsh-powell'`` : Orders the dual's nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the dual to form a smallest-last ordering, then applies the
+          greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          dual, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           the dual [2]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on the dual [3]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to the dual, running these
+          concurrently for larger graphs. The solution using the fewest colors
+          is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used.
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes in the dual to have the
           same color. Each iteration has a complexity $O(m + kn)$, where $n$ is
@@ -1209,6 +1358,19 @@ def face_list_coloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -1250,6 +1412,10 @@ def face_list_coloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``allowed_cols`` has a face not in the calculated embedding of
         ``G``.
 
@@ -1291,13 +1457,14 @@ def face_list_coloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0:
         return {}
     if allowed_cols is None or allowed_cols == {}:
         return face_coloring(
             G, pos, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(allowed_cols, dict):
         raise TypeError(
@@ -1323,7 +1490,8 @@ def face_list_coloring(
         face_allowed_cols[i] = ac_canon[faces[i]]
     c = node_list_coloring(
         H, face_allowed_cols, strategy=strategy, opt_alg=opt_alg,
-        it_limit=it_limit, verbose=verbose
+        it_limit=it_limit, verbose=verbose, time_limit=time_limit,
+        n_jobs=n_jobs
     )
     return {tuple(faces[i]): c[i] for i in range(len(H))}
 
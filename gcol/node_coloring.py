@@ -1,106 +1,326 @@
 """Node coloring functions."""
 
 import networkx as nx
+import numpy as np
 import itertools
+import os
+import pickle
 import random
+import time
+import bisect
+import multiprocessing
+import queue
+from array import array
 from collections import deque
-from queue import PriorityQueue
-from heapdict import heapdict
-
-
-class _Coloring:
-    # Class for storing details of a coloring and maintaining a queue of
-    # uncolored nodes' saturation degrees. Used by the backtracking algorithm
-    def __init__(self, G, C):
-        # Initialize the coloring of G using the given clique C
-        self._adjcols = {u: {} for u in G}
-        self._colsize = {}
-        self._d = {u: G.degree(u) for u in G}
-        self._c = {C[i]: i for i in range(len(C))}
-        for u in self._c:
-            i = self._c[u]
-            if i not in self._colsize:
-                self._colsize[i] = 0
-            self._colsize[i] += 1
-            for v in G[u]:
-                if v not in self._c:
-                    if i not in self._adjcols[v]:
-                        self._adjcols[v][i] = 0
-                    self._adjcols[v][i] += 1
-                    self._d[v] -= 1
-        self._q = heapdict()
-        for u in G:
-            if u not in self._c:
-                self._q[u] = (-len(self._adjcols[u]), -self._d[u])
 
-    def __len__(self):
-        # Return the number of colored nodes
-        return len(self._c)
 
-    def currentNodeCol(self, u):
-        # Return the current color of node u
-        return self._c[u]
+class _CSRGraph:
+    # Compact, array-based representation of a graph used by the internal
+    # coloring algorithms. The n nodes of G are relabeled 0,1,...,n-1 according
+    # to their iteration order in G, and the neighbors of node u are held in
+    # indices[indptr[u]:indptr[u+1]] (compressed sparse row format). Colorings
+    # are then held in lists indexed by these labels. The original node labels
+    # are kept in nodes so that colorings can be mapped back afterwards
+    def __init__(self, G):
+        self.nodes = list(G)
+        self.index = {u: i for i, u in enumerate(self.nodes)}
+        self.indptr = array("q", [0])
+        self.indices = array("l")
+        for u in self.nodes:
+            self.indices.extend(self.index[v] for v in G[u])
+            self.indptr.append(len(self.indices))
 
-    def nodeFeasibleForCol(self, u, i):
-        # Return True iff node u is not adjacent to a node with color i
-        if i in self._adjcols[u]:
-            return False
-        else:
-            return True
+    def __len__(self):
+        # Return the number of nodes
+        return len(self.nodes)
+
+    def __iter__(self):
+        # Iterate over the (relabeled) nodes 0,1,...,n-1
+        return iter(range(len(self.nodes)))
+
+    def __getitem__(self, u):
+        # Return the neighbors of node u
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def degree(self, u):
+        # Return the degree of node u
+        return self.indptr[u + 1] - self.indptr[u]
+
+    def number_of_edges(self):
+        # Return the number of edges
+        return len(self.indices) // 2
+
+    def edges(self):
+        # Iterate over the edges {u, v}, each reported once with u < v
+        for u in self:
+            for v in self[u]:
+                if u < v:
+                    yield u, v
+
+    def to_labels(self, c):
+        # Convert a list c indexed by 0,1,...,n-1 into a dict keyed by the
+        # original node labels
+        return {self.nodes[u]: c[u] for u in self}
+
+    def density(self):
+        # Return the density of the graph
+        n = len(self)
+        if n <= 1:
+            return 0.0
+        return len(self.indices) / (n * (n - 1))
+
+    def adjacency_matrix(self):
+        # Return the adjacency matrix as an n x n NumPy array of bools, so that
+        # row u acts as a bitset of the neighbors of node u
+        n = len(self)
+        indptr = np.frombuffer(self.indptr, dtype=self.indptr.typecode)
+        indices = np.frombuffer(self.indices, dtype=self.indices.typecode)
+        M = np.zeros((n, n), dtype=bool)
+        M[np.repeat(np.arange(n), np.diff(indptr)), indices] = True
+        return M
+
+    def components(self):
+        # Return the connected components of the graph, each as a list of
+        # nodes
+        seen = [False for u in self]
+        comps = []
+        for s in self:
+            if not seen[s]:
+                seen[s] = True
+                V = [s]
+                for u in V:
+                    for v in self[u]:
+                        if not seen[v]:
+                            seen[v] = True
+                            V.append(v)
+                comps.append(V)
+        return comps
+
+    def subgraph(self, V):
+        # Return the subgraph induced by the list of nodes V. In the subgraph,
+        # the ith node corresponds to node V[i] of this graph
+        H = _CSRGraph.__new__(_CSRGraph)
+        H.nodes = V
+        H.index = {u: i for i, u in enumerate(V)}
+        H.indptr = array("q", [0])
+        H.indices = array("l")
+        for u in V:
+            H.indices.extend(H.index[v] for v in self[u] if v in H.index)
+            H.indptr.append(len(H.indices))
+        return H
+
+
+class _BucketQueue:
+    # Bucket-based priority queue of nodes, each with two integer keys s and
+    # d. Nodes are returned in decreasing order of s, with ties broken by
+    # decreasing order of d. A node u is held in the bucket B[s][d], and each
+    # bucket is a dict used as an insertion-ordered set, so remaining ties are
+    # broken in favour of the node that entered the bucket first. Nodes are
+    # moved between buckets in O(1) time when their keys change, meaning that
+    # no stale entries are accumulated. This is used by the DSatur algorithms,
+    # where s is a node's saturation degree and d is its degree in the graph
+    # induced by uncolored nodes, and by the RLF algorithm.
+    def __init__(self, n):
+        # Initialize an empty queue for nodes 0,1,...,n-1
+        self._B = {}
+        self._s = [0 for u in range(n)]
+        self._d = [0 for u in range(n)]
+        self._top = {}
+        self._maxs = 0
+        self._size = 0
 
-    def getNextNode(self):
-        # Identify the next node to color based on dsatur heuristic. Return
-        # None if q is empty (meaning all nodes are colored)
-        if self._q:
-            return self._q.peekitem()[0]
-        else:
+    def __len__(self):
+        # Return the number of nodes in the queue
+        return self._size
+
+    def push(self, u, s, d):
+        # Add node u to the queue using the keys s and d
+        self._s[u], self._d[u] = s, d
+        if s not in self._B:
+            self._B[s] = {}
+            self._top[s] = d
+        Bs = self._B[s]
+        if d not in Bs:
+            Bs[d] = {}
+        Bs[d][u] = None
+        if d > self._top[s]:
+            self._top[s] = d
+        if s > self._maxs:
+            self._maxs = s
+        self._size += 1
+
+    def remove(self, u):
+        # Remove node u from the queue
+        s, d = self._s[u], self._d[u]
+        Bs = self._B[s]
+        del Bs[d][u]
+        if not Bs[d]:
+            del Bs[d]
+            if not Bs:
+                del self._B[s]
+                del self._top[s]
+        self._size -= 1
+
+    def update(self, u, s, d):
+        # Change the keys of the queued node u to s and d
+        self.remove(u)
+        self.push(u, s, d)
+
+    def pop(self):
+        # Remove and return the node with the highest key s, breaking ties
+        # using the highest key d
+        if self._maxs not in self._B:
+            self._maxs = max(self._B)
+        Bs = self._B[self._maxs]
+        d = self._top[self._maxs]
+        while d not in Bs:
+            d -= 1
+        self._top[self._maxs] = d
+        u = next(iter(Bs[d]))
+        self.remove(u)
+        return u
+
+
+class _MoveBuckets:
+    # Bucket-based structure holding a set of moves, each identified by an
+    # integer e and having a numeric key giving the change in cost that the
+    # move would bring. Moves with equal keys are held in the same bucket,
+    # which is a list, with the position of each move recorded so that moves
+    # can be added, removed and re-keyed in O(1) time (plus the time needed to
+    # maintain the sorted list of distinct keys). This is used by PartialCol,
+    # where only the moves of nodes neighboring a changed node are altered in
+    # each iteration
+    def __init__(self):
+        # Initialize an empty structure
+        self._B = {}
+        self._keys = []
+        self._key = {}
+        self._pos = {}
+
+    def add(self, e, key):
+        # Add the move e using the given key
+        if key not in self._B:
+            self._B[key] = []
+            bisect.insort(self._keys, key)
+        L = self._B[key]
+        self._key[e], self._pos[e] = key, len(L)
+        L.append(e)
+
+    def remove(self, e):
+        # Remove the move e
+        key = self._key.pop(e)
+        L, i = self._B[key], self._pos.pop(e)
+        last = L.pop()
+        if last != e:
+            L[i], self._pos[last] = last, i
+        if not L:
+            del self._B[key]
+            del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def update(self, e, key):
+        # Change the key of the move e
+        if self._key[e] != key:
+            self.remove(e)
+            self.add(e, key)
+
+    def choose(self, threshold, istabu):
+        # Return a move with the lowest key that is either not tabu, or that
+        # has a key below threshold, together with its key. Ties are broken
+        # randomly. Returns None if all moves are tabu
+        for key in self._keys:
+            L = self._B[key]
+            if key < threshold:
+                return L[random.randrange(len(L))], key
+            # Try a few random moves in the bucket before scanning it
+            for _ in range(3):
+                e = L[random.randrange(len(L))]
+                if not istabu(e):
+                    return e, key
+            L = [e for e in L if not istabu(e)]
+            if L:
+                return random.choice(L), key
+        return None
+
+
+class _Checkpoint:
+    # Periodically saves the state of an optimization to a file, so that the
+    # search can be resumed later. The routines currently running form a
+    # stack, with each holding a dict describing its state. Routines in tight
+    # loops call update() when due() is True; outer routines call update()
+    # before calling inner routines. Each call to _localsearchcol is numbered
+    # and the results of completed calls are also saved, so that when a search
+    # is resumed, these calls return immediately and the interrupted call
+    # continues from its saved state, with the same random number sequence
+    def __init__(self, filename, interval, resume_from=None):
+        # Initialize the structure, loading the saved data if resuming
+        self.filename, self.interval = filename, interval
+        self.initial, self.done, self.stack, self.calls = None, [], [], 0
+        self._saved, self._last = None, time.monotonic()
+        if resume_from is not None:
+            with open(resume_from, "rb") as f:
+                self._saved = pickle.load(f)
+            self.initial, self.done = self._saved["initial"], \
+                self._saved["done"]
+
+    def check(self, n, opt_alg):
+        # Raise an error if the saved data is from a different problem
+        if self._saved is not None and (
+            self._saved["n"] != n or self._saved["opt_alg"] != opt_alg
+        ):
+            raise ValueError(
+                "Error, resume_from must be a checkpoint made using the same "
+                "graph and opt_alg"
+            )
+        self.n, self.opt_alg = n, opt_alg
+
+    def push(self):
+        # Add a routine to the stack
+        self.stack.append(None)
+
+    def pop(self):
+        # Remove the innermost routine from the stack
+        self.stack.pop()
+
+    def restore(self):
+        # Return the saved state of the innermost routine if the search is
+        # being resumed, or None otherwise. When the routine that saved the
+        # data restores its state, the random number generator is restored
+        # too, and the resumption is complete
+        if self._saved is None:
             return None
-
-    def assignNodeToCol(self, G, u, i):
-        # Assign node u to color i and update data structures
-        del self._q[u]
-        self._c[u] = i
-        if i not in self._colsize:
-            self._colsize[i] = 0
-        self._colsize[i] += 1
-        for v in G[u]:
-            if v not in self._c:
-                if i not in self._adjcols[v]:
-                    self._adjcols[v][i] = 0
-                self._adjcols[v][i] += 1
-                self._d[v] -= 1
-                self._q[v] = (-len(self._adjcols[v]), -self._d[v])
-
-    def unassignNodeFromCol(self, G, u):
-        # Unassign node u from its current color and update data structures
-        i = self._c[u]
-        del self._c[u]
-        self._colsize[i] -= 1
-        if self._colsize[i] == 0:
-            del self._colsize[i]
-        self._d[u] = 0
-        self._adjcols[u].clear()
-        for v in G[u]:
-            if v not in self._c:
-                self._d[u] += 1
-                self._adjcols[v][i] -= 1
-                if self._adjcols[v][i] == 0:
-                    del self._adjcols[v][i]
-                self._d[v] += 1
-                self._q[v] = (-len(self._adjcols[v]), -self._d[v])
-            else:
-                if self._c[v] not in self._adjcols[u]:
-                    self._adjcols[u][self._c[v]] = 0
-                self._adjcols[u][self._c[v]] += 1
-        self._q[u] = (-len(self._adjcols[u]), -self._d[u])
-
-    def numCols(self):
-        # Return the number of different colors being used by the coloring
-        return len(self._colsize)
-
-
-def _check_params(G, strategy, opt_alg, it_limit, verbose):
-    greedy_methods = {"random", "welsh_powell", "dsatur", "rlf"}
+        depth, saved = len(self.stack) - 1, self._saved["stack"]
+        if depth == len(saved) - 1:
+            random.setstate(self._saved["random"])
+            self._saved = None
+        return saved[depth]
+
+    def due(self):
+        # Return True if the state should be written to the file now
+        return (self.filename is not None
+                and time.monotonic() - self._last >= self.interval)
+
+    def update(self, state):
+        # Record the state of the innermost routine. If due, the states of
+        # all routines are written to the file, replacing it atomically. The
+        # file is not written until any resumption is complete
+        self.stack[-1] = state
+        if self._saved is not None or not self.due():
+            return
+        data = {"n": self.n, "opt_alg": self.opt_alg,
+                "initial": self.initial, "done": self.done,
+                "stack": self.stack, "random": random.getstate()}
+        with open(self.filename + ".tmp", "wb") as f:
+            pickle.dump(data, f)
+        os.replace(self.filename + ".tmp", self.filename)
+        self._last = time.monotonic()
+
+
+def _check_params(G, strategy, opt_alg, it_limit, verbose,
+                  time_limit=None, n_jobs=1, eq_alg=1):
+    greedy_methods = {
+        "random", "welsh_powell", "smallest_last", "jones_plassmann",
+        "dsatur", "rlf", "portfolio"
+    }
     opt_methods = {1, 2, 3, 4, 5, None}
     if strategy not in greedy_methods:
         raise ValueError(
@@ -110,14 +330,34 @@ def _check_params(G, strategy, opt_alg, it_limit, verbose):
         raise ValueError(
             "Error, chosen optimisation method must be one of", opt_methods
         )
-    if not isinstance(it_limit, int) or it_limit < 0:
+    # bool is a subclass of int, so True and False are rejected explicitly
+    if (not isinstance(it_limit, int) or isinstance(it_limit, bool)
+            or it_limit < 0):
         raise ValueError(
             "Error, it_limit parameter must be a non-negative integer"
         )
-    if not isinstance(verbose, int) or verbose < 0:
+    if (not isinstance(verbose, int) or isinstance(verbose, bool)
+            or verbose < 0):
         raise ValueError(
             "Error, verbose parameter must be a non-negative integer"
         )
+    if time_limit is not None and (
+        not isinstance(time_limit, (int, float))
+        or isinstance(time_limit, bool) or time_limit < 0
+    ):
+        raise ValueError(
+            "Error, time_limit parameter must be None or a non-negative "
+            "number"
+        )
+    if (not isinstance(n_jobs, int) or isinstance(n_jobs, bool)
+            or n_jobs < 1):
+        raise ValueError(
+            "Error, n_jobs parameter must be a positive integer"
+        )
+    if eq_alg not in {1, 2}:
+        raise ValueError(
+            "Error, chosen balancing method must be one of", {1, 2}
+        )
     if G.is_directed() or G.is_multigraph():
         raise NotImplementedError(
             "Error, this method cannot be used with directed graphs or "
@@ -130,239 +370,493 @@ def _check_params(G, strategy, opt_alg, it_limit, verbose):
         )
 
 
+def _getdeadline(time_limit):
+    # Converts a time limit (in seconds) into an absolute deadline on the
+    # monotonic clock. None signifies that no time limit applies
+    if time_limit is None:
+        return None
+    return time.monotonic() + time_limit
+
+
+def _timeup(deadline):
+    # Returns True if the deadline has passed. This is cheap, but callers in
+    # tight loops should still only check it every few iterations
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _beaten(bestk, k):
+    # Returns True if another worker process has already found a solution
+    # using at most k colors. bestk is a shared multiprocessing.Value, or None
+    # if only one process is being used
+    return bestk is not None and bestk.value <= k
+
+
 def _getNodeWeights(G, weight):
-    # Puts all node weights into a dict W
-    W = {}
+    # Puts all node weights into a list W, where W[i] is the weight of the ith
+    # node of G (i.e., the labelling used by _CSRGraph)
+    W = []
     for u in G:
         if weight is None:
-            W[u] = 1
+            W.append(1)
         else:
             try:
-                W[u] = G.nodes[u][weight]
+                W.append(G.nodes[u][weight])
             except KeyError:
                 raise ValueError(
                     "Error, all nodes must feature the property", weight
                 )
-            if W[u] <= 0:
+            if W[-1] <= 0:
                 raise ValueError("Error, all node weights must be positive")
     return W
 
 
 def _getEdgeWeights(G, weight):
-    # Puts all edge weights into a dict
-    W = {}
+    # Puts all edge weights into a NumPy array W aligned with the CSR arrays
+    # of _CSRGraph(G), so that W[e] is the weight of the edge to the node
+    # indices[e]. If weight is None, all edges have a weight of 1, and None is
+    # returned instead. Integer weights are held in an int64 array, unless
+    # their sums could overflow, in which case Python integers are used
+    if weight is None:
+        return None
+    W = []
     for u in G:
         for v in G[u]:
-            if weight is None:
-                W[u, v] = 1
+            try:
+                W.append(G[u][v][weight])
+            except KeyError:
+                raise ValueError(
+                    "Error, all edges must feature the property", weight
+                )
+            if W[-1] <= 0:
+                raise ValueError("Error, all edge weights must be postive")
+    if all(isinstance(x, (int, np.integer)) for x in W):
+        if sum(W) <= np.iinfo(np.int64).max:
+            return np.array(W, dtype=np.int64)
+        return np.array(W, dtype=object)
+    return np.array(W, dtype=np.float64)
+
+
+def _getSubgraphWeights(W, G, V, edges):
+    # Restricts the node weights W, or the edge weights W if edges is True
+    # (as given by _getNodeWeights or _getEdgeWeights), to the subgraph of G
+    # induced by the list of nodes V. The edge weights follow the order used
+    # by G.subgraph(V)
+    if not edges:
+        return [W[u] for u in V]
+    if W is None:
+        return None
+    inV = set(V)
+    return W[[e for u in V for e in range(G.indptr[u], G.indptr[u + 1])
+              if G.indices[e] in inV]]
+
+
+def _restrictcoloring(c, V):
+    # Returns the coloring c restricted to the list of nodes V, with colors
+    # relabeled as 0,1,...
+    cols = {j: i for i, j in enumerate(sorted({c[u] for u in V}))}
+    return [cols[c[u]] for u in V]
+
+
+def _peel(G, k):
+    # Repeatedly removes nodes with fewer than k neighbors among the remaining
+    # nodes, and returns the list P of removed nodes in the order of removal.
+    # The remaining nodes form the k-core of G. When nodes are colored in the
+    # reverse of this order after the k-core, each has fewer than k colored
+    # neighbors, and can therefore be assigned one of the colors 0,...,k-1
+    d = [G.degree(u) for u in G]
+    removed = [d[u] < k for u in G]
+    P = [u for u in G if removed[u]]
+    for u in P:
+        for v in G[u]:
+            if not removed[v]:
+                d[v] -= 1
+                if d[v] < k:
+                    removed[v] = True
+                    P.append(v)
+    return P
+
+
+def _solvecore(G, P, target, solve):
+    # Colors the nodes of G that are not in the list P using the function
+    # solve(H, V, target), where H is the subgraph induced by these nodes V.
+    # The nodes of P, as given by _peel(G, target), are then colored
+    # greedily in reverse order, so that they do not need more than the
+    # target number of colors
+    inP = [False for u in G]
+    for u in P:
+        inP[u] = True
+    V = [u for u in G if not inP[u]]
+    c = [-1 for u in G]
+    if V:
+        cH = solve(G.subgraph(V), V, target)
+        for i, u in enumerate(V):
+            c[u] = cH[i]
+    for u in reversed(P):
+        adjcols = {c[v] for v in G[u]}
+        for j in itertools.count():
+            if j not in adjcols:
+                break
+        c[u] = j
+    return c
+
+
+def _solvecomponents(G, comps, target, solve):
+    # Colors each connected component of G separately using the function
+    # solve(H, V, target), where H is the subgraph induced by the component's
+    # nodes V. Components are considered in decreasing order of size. Color
+    # labels are reused in each component, so the number of colors used is
+    # the maximum used in any component. The target is therefore raised to
+    # this value as components are colored, since there is no benefit in
+    # using fewer colors in the remaining components
+    c = [-1 for u in G]
+    for V in sorted(comps, key=len, reverse=True):
+        cH = solve(G.subgraph(V), V, target)
+        target = max(target, max(cH) + 1)
+        for i, u in enumerate(V):
+            c[u] = cH[i]
+    return c
+
+
+def _reduceMIS(G, W):
+    def remove(v):
+        # Deletes node v from the graph and queues its neighbors
+        for u in adj.pop(v):
+            adj[u].discard(v)
+            push(u)
+
+    def push(v):
+        if v not in queued:
+            queued.add(v)
+            Q.append(v)
+
+    def pushall(v):
+        # Queues node v and its neighbors, used when v's weight or
+        # neighborhood has changed
+        push(v)
+        for u in adj[v]:
+            push(u)
+
+    def reduce(v):
+        # Tries each reduction rule on node v, returning True iff one applies
+        N = adj[v]
+        if w[v] >= sum(w[u] for u in N):
+            # Neighborhood rule: v is at least as heavy as all its neighbors
+            # together, so v is in an optimal solution. This includes nodes of
+            # degree zero and, in unweighted graphs, nodes of degree one
+            log.append(("include", v))
+            for u in list(N):
+                remove(u)
+            remove(v)
+            return True
+        if len(N) == 1:
+            # Pendant rule: v is lighter than its neighbor u, so one of them
+            # is in an optimal solution. Removing v and reducing u's weight by
+            # w[v] means that u is chosen only if it is worth more than v
+            u = next(iter(N))
+            w[u] -= w[v]
+            log.append(("pendant", u, v))
+            remove(v)
+            pushall(u)
+            return True
+        for u in N:
+            if len(adj[u]) <= len(N) and w[u] >= w[v] and all(
+                x == v or x in N for x in adj[u]
+            ):
+                # Domination rule: N[u] is a subset of N[v] and u is at least
+                # as heavy as v, so v can always be replaced by u
+                remove(v)
+                return True
+        for u in N:
+            if len(adj[u]) >= len(N) and w[v] >= w[u] and all(
+                x == u or x in adj[u] for x in N
+            ):
+                # Domination rule, with v dominating its neighbor u
+                remove(u)
+                pushall(v)
+                return True
+        if len(N) == 2:
+            a, b = N
+            if b not in adj[a] and w[v] >= max(w[a], w[b]):
+                # Fold rule: an optimal solution contains v or both a and b,
+                # so v, a and b are replaced by a new node x, adjacent to the
+                # neighbors of a and b. Choosing x corresponds to choosing a
+                # and b; otherwise v is chosen
+                x = next(ids)
+                adj[x] = (adj[a] | adj[b]) - {v}
+                w[x] = w[a] + w[b] - w[v]
+                log.append(("fold", x, v, a, b))
+                for y in (v, a, b):
+                    remove(y)
+                for u in adj[x]:
+                    adj[u].add(x)
+                pushall(x)
+                return True
+        if N:
+            # Twin rule: a nonadjacent node u with the same neighbors as v is
+            # chosen in an optimal solution iff v is, so v is merged into u
+            y = min(N, key=lambda x: len(adj[x]))
+            for u in adj[y]:
+                if u != v and len(adj[u]) == len(N) and adj[u] == N:
+                    w[u] += w[v]
+                    log.append(("twin", u, v))
+                    remove(v)
+                    pushall(u)
+                    return True
+        return False
+
+    # Applies exact reduction rules for the maximum(-weighted) independent set
+    # problem to the graph G with node weights W. The graph is held in adj, a
+    # dict of neighbor sets, with weights in w. Nodes created by folding are
+    # labeled n,n+1,... Nodes are queued whenever their weight or neighborhood
+    # changes, and the rules are applied until the queue is empty. Returns the
+    # remaining graph (the kernel), its weights, and a log of the reductions,
+    # which is used by _liftMIS to turn a solution for the kernel into one for
+    # G
+    adj = {u: set(G[u]) for u in G}
+    w = {u: W[u] for u in G}
+    ids = itertools.count(len(G))
+    log = []
+    Q, queued = deque(G), set(G)
+    while Q:
+        v = Q.popleft()
+        queued.discard(v)
+        if v in adj:
+            reduce(v)
+    return adj, w, log
+
+
+def _liftMIS(S, log):
+    # Turns an independent set S of the kernel produced by _reduceMIS into an
+    # independent set of the original graph by undoing the reductions in
+    # reverse order
+    S = set(S)
+    for r in reversed(log):
+        if r[0] == "include":
+            S.add(r[1])
+        elif r[0] == "pendant":
+            if r[1] not in S:
+                S.add(r[2])
+        elif r[0] == "fold":
+            if r[1] in S:
+                S.remove(r[1])
+                S.update(r[3:])
             else:
-                try:
-                    W[u, v] = G[u][v][weight]
-                except KeyError:
-                    raise ValueError(
-                        "Error, all edges must feature the property", weight
-                    )
-                if W[u, v] <= 0:
-                    raise ValueError("Error, all edge weights must be postive")
-    return W
+                S.add(r[2])
+        elif r[1] in S:
+            S.add(r[2])
+    return S
 
 
-def _LS_equitable(G, c, k, W, verbose):
-    def getKempeChain(A, c, s, i, j):
-        status = {s: 1}
-        Q = deque([s])
-        Chain = set()
+def _LS_equitable(G, c, k, W, eq_alg, it_limit, verbose, deadline=None):
+    def getKempeChain(s, i, j):
+        # Returns the Kempe chain containing node s, formed of nodes with
+        # colors i and j, found using breadth-first search
+        Chain, Q = {s}, deque([s])
         while Q:
-            u = Q[0]
-            if c[u] == i:
-                colv = j
-            else:
-                colv = i
-            for v in A[u, colv]:
-                if v not in status:
-                    status[v] = 1
+            u = Q.popleft()
+            other = j if c[u] == i else i
+            for v in G[u]:
+                if c[v] == other and v not in Chain:
+                    Chain.add(v)
                     Q.append(v)
-            Q.popleft()
-            status[u] = 2
-            Chain.add(u)
         return Chain
 
-    def evaluateKempeMove(c, Chain, i, j):
-        for v in Chain:
-            if c[v] == i:
-                ColWeight[i] -= W[v]
-                ColWeight[j] += W[v]
-            elif c[v] == j:
-                ColWeight[j] -= W[v]
-                ColWeight[i] += W[v]
-        newCost = (sum((x - mean) ** 2 for x in ColWeight) /
-                   len(ColWeight)) ** 0.5
-        for v in Chain:
-            if c[v] == i:
-                ColWeight[i] += W[v]
-                ColWeight[j] -= W[v]
-            elif c[v] == j:
-                ColWeight[j] += W[v]
-                ColWeight[i] -= W[v]
-        return newCost
-
-    def doKempeMove(c, Chain, i, j):
-        for v in Chain:
-            if c[v] == i:
-                c[v] = j
-                ColWeight[i] -= W[v]
-                ColWeight[j] += W[v]
-                ColCard[i] -= 1
-                ColCard[j] += 1
-            elif c[v] == j:
-                c[v] = i
-                ColWeight[j] -= W[v]
-                ColWeight[i] += W[v]
-                ColCard[j] -= 1
-                ColCard[i] += 1
-
-    def evaluateSwapMove(c, u, v):
-        ColWeight[c[u]] += W[v] - W[u]
-        ColWeight[c[v]] += W[u] - W[v]
-        newCost = (sum((x - mean) ** 2 for x in ColWeight) /
-                   len(ColWeight)) ** 0.5
-        ColWeight[c[u]] += W[u] - W[v]
-        ColWeight[c[v]] += W[v] - W[u]
-        return newCost
-
-    def doSwapMove(c, u, v):
-        ColWeight[c[u]] += W[v] - W[u]
-        ColWeight[c[v]] += W[u] - W[v]
-        c[u], c[v] = c[v], c[u]
+    def change(i, j, delta):
+        # Returns the change in the sum of squared color class weights when
+        # delta is added to the weight of color i and removed from color j.
+        # The mean class weight does not change, so this is proportional to
+        # the change in the variance
+        return 2 * delta * (ColWeight[i] - ColWeight[j] + delta)
+
+    def isTabu(v, i, j):
+        # Returns True iff moving node v between colors i and j is tabu
+        return T[v].get(j if c[v] == i else i, 0) > its
+
+    def evaluatePair(i, j):
+        # Returns the best move that exchanges nodes between colors i and j,
+        # as a tuple giving the change in cost and the move, or (0, None) if
+        # no move is available. In steepest descent, only moves that reduce
+        # the cost are considered. In tabu search, any move that alters the
+        # cost is considered, unless it moves a node back to a color that is
+        # tabu for it and does not lead to a new best solution. Every Kempe
+        # chain of colors i and j is evaluated. Nodes whose Kempe chains are
+        # single nodes have no neighbors in the other color, so they can be
+        # swapped with any such node of the other color. These are indexed by
+        # weight so that, for each weight a in color i, the best weight b in
+        # color j is found by binary search, the best being nearest to
+        # a - D/2, where D is the difference in the weights of the two colors
+        bestVal = float("inf") if eq_alg == 2 else 0
+        bestMove, seen = None, set()
+        single = ({}, {})
+        for s in itertools.chain(Class[i], Class[j]):
+            if s in seen:
+                continue
+            Chain = getKempeChain(s, i, j)
+            seen |= Chain
+            if len(Chain) == 1 and not isTabu(s, i, j):
+                single[c[s] == j][W[s]] = s
+            if len(Chain) == len(Class[i]) + len(Class[j]):
+                # Interchanging the whole of both colors just relabels them
+                continue
+            delta = sum(W[v] if c[v] == j else -W[v] for v in Chain)
+            val = change(i, j, delta)
+            if delta != 0 and val < bestVal and (
+                SS + val < bestSS
+                or not any(isTabu(v, i, j) for v in Chain)
+            ):
+                bestVal, bestMove = val, (s, None)
+        B = sorted(single[1])
+        half = (ColWeight[i] - ColWeight[j]) / 2
+        for a in single[0]:
+            r = bisect.bisect_left(B, a - half)
+            for b in B[max(r - 2, 0):r + 2]:
+                if a != b and change(i, j, b - a) < bestVal:
+                    bestVal = change(i, j, b - a)
+                    bestMove = (single[0][a], single[1][b])
+        return bestVal, bestMove
+
+    def doMove(i, j, move):
+        # Applies a move between colors i and j, being either the interchange
+        # of the Kempe chain containing node u (if v is None), or the swap of
+        # nodes u and v. In tabu search, the moved nodes are then prevented
+        # from returning to their old colors for the next t iterations
+        u, v = move
+        Chain = getKempeChain(u, i, j) if v is None else {u, v}
+        t = int(0.6 * k) + random.randint(0, 9)
+        for x in Chain:
+            a, b = (i, j) if c[x] == i else (j, i)
+            Class[a].remove(x)
+            Class[b].add(x)
+            ColWeight[a] -= W[x]
+            ColWeight[b] += W[x]
+            c[x] = b
+            if eq_alg == 2:
+                T[x][a] = its + t
 
     # Main local search procedure for improving the balancing of each color
-    # class. This uses steepest descent and halts at the first observed local
-    # optimum
+    # class. With eq_alg=1, this uses steepest descent and halts at the first
+    # observed local optimum. With eq_alg=2, this uses tabu search, which
+    # always performs the best non-tabu move (even if it worsens the cost)
+    # and halts after it_limit iterations or when the cost cannot be reduced
+    # further. Both halt when the deadline passes. Class[i] is the set of
+    # nodes with color i, ColWeight[i] is their total weight, and SS is the
+    # sum of the squared class weights. T[v][i] gives the iteration until
+    # which node v cannot be moved to color i. Moves between colors i and j
+    # only alter the costs of moves involving i or j, so the best move for
+    # each pair of colors is kept in best, and only the pairs involving the
+    # two colors of the last move are evaluated again. (In tabu search, the
+    # best moves of other pairs therefore reflect the tabu status at the time
+    # of their evaluation.) This takes O(n + m + k^2) time per iteration
     if k <= 1:
         return c
+    Class = [set() for i in range(k)]
     ColWeight = [0 for i in range(k)]
-    ColCard = [0 for i in range(k)]
-    for v in c:
+    for v in G:
+        Class[c[v]].add(v)
         ColWeight[c[v]] += W[v]
-        ColCard[c[v]] += 1
     mean = sum(x for x in ColWeight) / len(ColWeight)
-    currentCost = (sum((x - mean) ** 2 for x in ColWeight) /
-                   len(ColWeight)) ** 0.5
+    # Determine a lower bound lb on SS. For integer weights, this is achieved
+    # when all class weights differ by at most one
+    total = sum(ColWeight)
+    if isinstance(total, int):
+        q, r = divmod(total, k)
+        lb = r * (q + 1) ** 2 + (k - r) * q ** 2
+    else:
+        lb = total ** 2 / k
+    its, T = 0, [{} for v in G]
+    SS = sum(x ** 2 for x in ColWeight)
+    bestSS, bestc = SS, list(c)
     if verbose > 0:
-        print("Running equitable local search algorithm using", k, "colors:")
-    V = list(G)
-    while True:
-        # Initialise data structures. KCRec[v,j] holds the size of the Kempe
-        # chain formed by node v and color j (once calculated). A[v,j] gives a
-        # list of all neighbours of v assigned to color j. These allow all
-        # possible Kempe chains to be evaluated in O(vk + m) time
-        KCRec = {v: [0 for j in range(k)] for v in G}
-        A = {(v, j): [] for v in G for j in range(k)}
-        for u in G:
-            for v in G[u]:
-                A[u, c[v]].append(v)
-        bestVal = currentCost
-        if verbose > 0:
-            print("    Found solution with cost (std. dev.)", currentCost)
-        for v in G:
-            i = c[v]
-            for j in range(k):
-                if i != j:
-                    if KCRec[v][j] == 0:
-                        # Kempe-Chain(v,i,j) not yet observed, so handle it
-                        Chain = getKempeChain(A, c, v, i, j)
-                        for u in Chain:
-                            if c[u] == i:
-                                KCRec[u][j] = len(Chain)
-                            else:
-                                KCRec[u][i] = len(Chain)
-                        if len(Chain) != ColCard[i] + ColCard[j]:
-                            neighborCost = evaluateKempeMove(c, Chain, i, j)
-                            if neighborCost < bestVal:
-                                bestVal, bestv, besti, bestj, moveType = (
-                                    neighborCost,
-                                    v,
-                                    i,
-                                    j,
-                                    1,
-                                )
-        # Now check all possible non-adjacent swaps. This takes O(n^2) time
-        for i in range(len(V) - 1):
-            for j in range(i + 1, len(V)):
-                u, v = V[i], V[j]
-                if (
-                    c[u] != c[v]
-                    and W[u] != W[v]
-                    and KCRec[u][c[v]] == 1
-                    and KCRec[v][c[u]] == 1
-                ):
-                    # Swapping u and v changes the cost and maintains
-                    # feasibility
-                    neighborCost = evaluateSwapMove(c, u, v)
-                    if neighborCost < bestVal:
-                        bestVal, bestu, bestv, moveType = neighborCost, u, v, 2
-        if bestVal == currentCost:
+        print("Running equitable",
+              "tabu search" if eq_alg == 2 else "local search",
+              "algorithm using", k, "colors:")
+        print("    Found solution with cost (std. dev.)",
+              (sum((x - mean) ** 2 for x in ColWeight) /
+               len(ColWeight)) ** 0.5, "at iteration", its)
+    best = {(i, j): evaluatePair(i, j)
+            for i in range(k) for j in range(i + 1, k)}
+    while not _timeup(deadline) and bestSS > lb:
+        if eq_alg == 2 and its >= it_limit:
             break
-        if moveType == 1:
-            Chain = getKempeChain(A, c, bestv, besti, bestj)
-            doKempeMove(c, Chain, besti, bestj)
-        else:
-            doSwapMove(c, bestu, bestv)
-        currentCost = bestVal
+        i, j = min(best, key=lambda p: best[p][0])
+        if best[i, j][1] is None:
+            break
+        its += 1
+        SS += best[i, j][0]
+        doMove(i, j, best[i, j][1])
+        if SS < bestSS:
+            bestSS, bestc = SS, list(c)
+            if verbose > 0:
+                print("    Found solution with cost (std. dev.)",
+                      (sum((x - mean) ** 2 for x in ColWeight) /
+                       len(ColWeight)) ** 0.5, "at iteration", its)
+        for x in range(k):
+            for p in [(min(i, x), max(i, x)), (min(j, x), max(j, x))]:
+                if p in best:
+                    best[p] = evaluatePair(*p)
     if verbose > 0:
-        print("Ending equitable local search algorithm - local optimum",
-              "achieved.")
-    return c
+        if _timeup(deadline):
+            reason = "time limit has been reached."
+        elif bestSS <= lb:
+            reason = "optimal balance achieved."
+        elif eq_alg == 2 and its >= it_limit:
+            reason = "iteration limit has been reached."
+        elif eq_alg == 2:
+            reason = "no permissible moves."
+        else:
+            reason = "local optimum achieved."
+        print("Ending equitable",
+              "tabu search" if eq_alg == 2 else "local search",
+              "algorithm -", reason)
+    return bestc
 
 
 def _dsatur_equitable(G, k, W):
     # Version of DSatur algorithm that seeks to balance the color class sizes.
     # First initialise the data structures for this heuristic.
-    # These are a priority queue q; the colors of each node c[v];
-    # the set of colors adjacent to each uncolored node (initially empty
-    # sets); the degree d[v] of each uncolored node in the graph induced
-    # by uncolored nodes; and the weight of each color class.
-    q = PriorityQueue()
-    c, adjcols, d = {}, {}, {}
+    # These are the colors of each node c[v] (-1 if uncolored); the set of
+    # colors adjacent to each uncolored node (initially empty sets); the
+    # degree d[v] of each uncolored node in the graph induced by uncolored
+    # nodes; the weight of each color class; and a bucket queue q.
+    c = [-1 for u in G]
+    adjcols = [set() for u in G]
+    d = [G.degree(u) for u in G]
     colweight = [0 for i in range(k)]
-    counter = itertools.count()
-    for u in G.nodes:
-        d[u] = G.degree(u)
-        adjcols[u] = set()
-        q.put((0, -d[u], next(counter), u))
-    while len(c) < len(G):
+    q = _BucketQueue(len(G))
+    for u in G:
+        q.push(u, 0, d[u])
+    while q:
         # Get the uncolored node u with max saturation degree, breaking
         # ties using the highest value for d. Remove u from q.
-        _, _, _, u = q.get()
-        if u not in c:
-            # node u has not yet been colored, so assign it to the feasible
-            # color class i that currently has the lowest weight
-            i, mincolweight = None, float("inf")
-            for j in range(k):
-                if j not in adjcols[u] and colweight[j] < mincolweight:
-                    i = j
-                    mincolweight = colweight[i]
-            if i is None:
-                # A k-coloring could not be achieved by this heuristic so quit
-                return None
-            c[u] = i
-            colweight[i] += W[u]
-            # Update the saturation degrees and d-values of the uncolored
-            # neighbors v, and update the priority queue q
-            for v in G[u]:
-                if v not in c:
-                    adjcols[v].add(i)
-                    d[v] -= 1
-                    q.put((-len(adjcols[v]), -d[v], next(counter), v))
+        u = q.pop()
+        # Assign u to the feasible color class i that currently has the
+        # lowest weight
+        i, mincolweight = None, float("inf")
+        for j in range(k):
+            if j not in adjcols[u] and colweight[j] < mincolweight:
+                i = j
+                mincolweight = colweight[i]
+        if i is None:
+            # A k-coloring could not be achieved by this heuristic so quit
+            return None
+        c[u] = i
+        colweight[i] += W[u]
+        # Update the saturation degrees and d-values of the uncolored
+        # neighbors v, and update their positions in q
+        for v in G[u]:
+            if c[v] == -1:
+                adjcols[v].add(i)
+                d[v] -= 1
+                q.update(v, len(adjcols[v]), d[v])
     return c
 
 
 def _greedy(G, V):
     # Greedy algorithm for graph coloring. This considers nodes of G in the
     # order given in V
-    c = {}
+    c = [-1 for u in G]
     for u in V:
-        adjcols = {c[v] for v in G[u] if v in c}
+        adjcols = {c[v] for v in G[u]}
         for j in itertools.count():
             if j not in adjcols:
                 break
@@ -372,210 +866,674 @@ def _greedy(G, V):
 
 def _dsatur(G, c=None):
     # Dsatur algorithm for graph coloring. First initialise the data
-    # structures. These are: the colors of each node c[v]; the degree d[v] of
-    # each uncolored node in the graph induced by uncolored nodes; the set of
-    # colors adjacent to each uncolored node (initially empty sets); and a
-    # priority queue q. In q, each element has 4 values for the node v. The
-    # first two are the the saturation degree of v, d[v] (as a tie breaker).
-    # The third value is a counter, which just stops comparisons being made
-    # with the final values, which might be of different types.
-    d, adjcols, q = {}, {}, PriorityQueue()
-    counter = itertools.count()
-    for u in G.nodes:
-        d[u] = G.degree(u)
-        adjcols[u] = set()
-        q.put((0, -d[u], next(counter), u))
+    # structures. These are: the colors of each node c[v] (-1 if uncolored);
+    # the degree d[v] of each uncolored node in the graph induced by uncolored
+    # nodes; the set of colors adjacent to each uncolored node (initially
+    # empty sets); and a bucket queue q holding the uncolored nodes according
+    # to their saturation degrees and d-values.
+    d = [G.degree(u) for u in G]
+    adjcols = [set() for u in G]
     # If any nodes are already colored in c, update the data structures
     # accordingly
+    col = [-1 for u in G]
     if c is not None:
         if not isinstance(c, dict):
             raise TypeError(
                 "Error, c should be a dict that assigns a subset of nodes ",
                 "to colors"
             )
+        for u in c:
+            col[u] = c[u]
         for u in c:
             for v in G[u]:
-                if v not in c:
+                if col[v] == -1:
                     adjcols[v].add(c[u])
                     d[v] -= 1
-                    q.put((-len(adjcols[v]), -d[v], next(counter), v))
-                elif c[u] == c[v]:
+                elif c[u] == col[v]:
                     raise ValueError(
                         "Error, clashing nodes defined in supplied coloring"
                     )
-    else:
-        c = {}
+    c = col
+    q = _BucketQueue(len(G))
+    for u in G:
+        if c[u] == -1:
+            q.push(u, len(adjcols[u]), d[u])
     # Now color all remaining nodes
-    while len(c) < len(G):
+    while q:
         # Get the uncolored node u with max saturation degree, breaking ties
         # using the highest value for d. Remove u from q.
-        _, _, _, u = q.get()
-        if u not in c:
-            # Get lowest color label i for uncolored node u
-            for i in itertools.count():
-                if i not in adjcols[u]:
-                    break
-            c[u] = i
-            # Update the data structures
-            for v in G[u]:
-                if v not in c:
-                    adjcols[v].add(i)
-                    d[v] -= 1
-                    q.put((-len(adjcols[v]), -d[v], next(counter), v))
+        u = q.pop()
+        # Get lowest color label i for uncolored node u
+        for i in itertools.count():
+            if i not in adjcols[u]:
+                break
+        c[u] = i
+        # Update the data structures
+        for v in G[u]:
+            if c[v] == -1:
+                adjcols[v].add(i)
+                d[v] -= 1
+                q.update(v, len(adjcols[v]), d[v])
     return c
 
 
 def _rlf(G):
     def update_rlf(u):
-        # Remove u from X (it has been colored) and move all uncolored
-        # neighbors of u from X to Y
-        X.remove(u)
+        # Node u has just been colored, having been removed from X. Adjust the
+        # counts of its uncolored neighbors, then move its neighbors in X to Y,
+        # again adjusting the counts of their uncolored neighbors. Only the
+        # counts of nodes adjacent to a node that changes status are altered
         for v in G[u]:
-            if v not in c:
-                X.discard(v)
-                Y.add(v)
-        # Recalculate the contets of NInX and NInY. First calculate a set D2
-        # of all uncolored nodes within distance two of u.
-        D2 = set()
+            if c[v] == -1:
+                NInX[v] -= 1
+                if inX[v]:
+                    q.update(v, NInY[v], -NInX[v])
         for v in G[u]:
-            if v not in c:
-                D2.add(v)
+            if inX[v]:
+                inX[v] = False
+                q.remove(v)
+                Y.append(v)
                 for w in G[v]:
-                    if w not in c:
-                        D2.add(w)
-        # For each node v in D2, recalculate the number of (uncolored)
-        # neighbors in X and Y
-        for v in D2:
-            NInX[v] = 0
-            NInY[v] = 0
-            for w in G[v]:
-                if w not in c:
-                    if w in X:
-                        NInX[v] += 1
-                    elif w in Y:
-                        NInY[v] += 1
+                    if c[w] == -1:
+                        NInX[w] -= 1
+                        NInY[w] += 1
+                        if inX[w]:
+                            q.update(w, NInY[w], -NInX[w])
 
     # RLF algorithm for graph coloring. Here, X is the set of uncolored nodes
     # not adjacent to any nodes colored with color i, and Y is the set of
-    # uncolored nodes that are adjcent to nodes colored with i.
-    c, Y, n, i = {}, set(), len(G), 0
-    X = set(G.nodes())
+    # uncolored nodes that are adjcent to nodes colored with i. For each
+    # uncolored node v, NInX[v] and NInY[v] give the number of neighbors of v
+    # in X and Y respectively. The nodes in X are held in the bucket queue q,
+    # prioritized by the largest value of NInY, and then the smallest value of
+    # NInX.
+    c, i = [-1 for u in G], 0
+    inX = [True for u in G]
+    NInX, NInY = [G.degree(u) for u in G], [0 for u in G]
+    q = _BucketQueue(len(G))
+    X = list(G)
     while X:
-        # Construct color class i. First, for each nodes u in X, calculate the
-        # number of neighbors it has in X and Y
-        NInX, NInY = {u: 0 for u in X}, {u: 0 for u in X}
-        for u in X:
-            for v in G[u]:
-                if v in X:
-                    NInX[u] += 1
-        # Identify and colur the uncolored node u in X that has the most
-        # neighbors in X
-        maxVal = -1
+        # Construct color class i. Identify and color the uncolored node u in
+        # X that has the most neighbors in X
+        Y = []
+        u = max(X, key=NInX.__getitem__)
         for v in X:
-            if NInX[v] > maxVal:
-                maxVal, u = NInX[v], v
-        c[u] = i
-        update_rlf(u)
-        while X:
-            # Identify and color the node u in X that has the largest number
-            # of neighbors in Y. Break ties according to the min neighbors in X
-            mxVal, mnVal = -1, n
-            for v in X:
-                if NInY[v] > mxVal or (NInY[v] == mxVal and NInX[v] < mnVal):
-                    mxVal, mnVal, u = NInY[v], NInX[v], v
+            if v != u:
+                q.push(v, NInY[v], -NInX[v])
+        while True:
+            inX[u] = False
             c[u] = i
             update_rlf(u)
-        # Have finished constructing color class i
-        X, Y = Y, X
+            if not q:
+                break
+            # Identify the node u in X that has the largest number of
+            # neighbors in Y, breaking ties according to the min neighbors in X
+            u = q.pop()
+        # Have finished constructing color class i. All uncolored nodes are
+        # now in Y, which becomes the new X
+        for v in Y:
+            inX[v] = True
+            NInX[v], NInY[v] = NInY[v], 0
+        X = Y
         i += 1
     return c
 
 
-def _backtrackcol(G, targetcols, verbose):
-    # Exact backtracking algorithm for node coloring
-    C = list(nx.approximation.max_clique(G))
+def _smallestlast(G):
+    # Smallest-last ordering of the nodes of G. Nodes are repeatedly removed
+    # from the graph, each time choosing a node of minimum degree in the graph
+    # induced by the remaining nodes. The nodes are held in buckets B[d]
+    # according to these degrees, allowing the whole process to be completed
+    # in O(n + m) time. Returns the reverse of the removal order, together
+    # with the degeneracy of G (the largest degree seen at the time of a
+    # node's removal)
+    d = [G.degree(u) for u in G]
+    B = [{} for i in range(max(d, default=0) + 1)]
+    for u in G:
+        B[d[u]][u] = None
+    removed = [False for u in G]
+    V, i, degeneracy = [], 0, 0
+    for _ in G:
+        # Identify the lowest nonempty bucket. This is at most one below the
+        # bucket used in the previous step
+        i = max(i - 1, 0)
+        while not B[i]:
+            i += 1
+        u, _ = B[i].popitem()
+        removed[u] = True
+        V.append(u)
+        degeneracy = max(degeneracy, i)
+        for v in G[u]:
+            if not removed[v]:
+                del B[d[v]][v]
+                d[v] -= 1
+                B[d[v]][v] = None
+    V.reverse()
+    return V, degeneracy
+
+
+def _greedy_dense(G, V):
+    # Version of the greedy algorithm for dense graphs. Rows of the adjacency
+    # matrix M are used as bitsets, so the colors adjacent to a node u are
+    # gathered using a single vectorized operation on M[u]
+    M = G.adjacency_matrix()
+    c = np.full(len(G), -1)
+    for u in V:
+        adjcols = c[M[u]]
+        free = np.ones(len(adjcols) + 1, dtype=bool)
+        free[adjcols[(adjcols >= 0) & (adjcols < len(free))]] = False
+        c[u] = free.argmax()
+    return c.tolist()
+
+
+def _dsatur_dense(G):
+    # Version of the DSatur algorithm for dense graphs. Here, M is the
+    # adjacency matrix; adjcols[v, j] is True iff the uncolored node v is
+    # adjacent to a node of color j; sat[v] is the saturation degree of v;
+    # and d[v] is the degree of v in the graph induced by uncolored nodes.
+    # The priority of each uncolored node is held in key, allowing the next
+    # node to be selected by a vectorized argmax
+    n = len(G)
+    M = G.adjacency_matrix()
+    c = np.full(n, -1)
+    d = M.sum(axis=1)
+    sat = np.zeros(n, dtype=np.int64)
+    adjcols = np.zeros((n, int(d.max()) + 1), dtype=bool)
+    key = d.copy()
+    for _ in range(n):
+        # Get the uncolored node u with max saturation degree, breaking ties
+        # using the highest value for d, and assign u to the lowest feasible
+        # color label i
+        u = key.argmax()
+        i = adjcols[u].argmin()
+        c[u] = i
+        key[u] = -1
+        # Update the saturation degrees and d-values of the uncolored
+        # neighbors of u
+        N = np.flatnonzero(M[u] & (c == -1))
+        sat[N] += ~adjcols[N, i]
+        adjcols[N, i] = True
+        d[N] -= 1
+        key[N] = sat[N] * (n + 1) + d[N]
+    return c.tolist()
+
+
+def _rlf_dense(G):
+    # Version of the RLF algorithm for dense graphs. Here, M is the adjacency
+    # matrix, and X and Y are bitsets of the nodes in the sets X and Y used by
+    # _rlf. For each uncolored node v, NInX[v] and NInY[v] give the number of
+    # neighbors of v in X and Y. These are adjusted using vectorized
+    # operations on the rows of M as nodes are colored or moved to Y
+    n = len(G)
+    M = G.adjacency_matrix()
+    c = np.full(n, -1)
+    NInX, NInY = M.sum(axis=1), np.zeros(n, dtype=np.int64)
+    X = np.ones(n, dtype=bool)
+    i = 0
+    while X.any():
+        # Construct color class i. Identify and color the node u in X that has
+        # the most neighbors in X
+        Y = np.zeros(n, dtype=bool)
+        u = np.where(X, NInX, -1).argmax()
+        while True:
+            c[u] = i
+            X[u] = False
+            NInX -= M[u]
+            # Move all neighbors of u in X to Y
+            N = M[u] & X
+            X &= ~N
+            Y |= N
+            delta = M[N].sum(axis=0)
+            NInX -= delta
+            NInY += delta
+            if not X.any():
+                break
+            # Identify the node u in X that has the largest number of
+            # neighbors in Y, breaking ties according to the min neighbors in X
+            u = np.where(X, NInY * (n + 1) - NInX, -n - 1).argmax()
+        # Have finished constructing color class i. All uncolored nodes are
+        # now in Y, which becomes the new X
+        NInX, NInY = NInY, np.zeros(n, dtype=np.int64)
+        X = Y
+        i += 1
+    return c.tolist()
+
+
+def _lowestfree(owner, col, size):
+    # For each i in 0,1,...,size-1, return the lowest color label not among
+    # the values col[e] for which owner[e] = i. The values in owner must be
+    # nondecreasing. The colors are considered in windows of 63 labels, each
+    # encoded as a bitmask and combined using a single vectorized operation,
+    # so that only nodes with all labels in the window used need to be
+    # considered further
+    free = np.zeros(size, dtype=np.int64)
+    while len(owner) > 0:
+        base = free[owner]
+        inwin = (col >= base) & (col < base + 63)
+        if not inwin.any():
+            break
+        w = owner[inwin]
+        first = np.flatnonzero(np.diff(w, prepend=-1))
+        bits = np.left_shift(1, col[inwin] - base[inwin])
+        mask = np.bitwise_or.reduceat(bits, first)
+        o, full = w[first], mask == (1 << 63) - 1
+        lowest = ~mask[~full] & (mask[~full] + 1)
+        free[o[~full]] += np.log2(lowest).astype(np.int64)
+        free[o[full]] += 63
+        # Only nodes whose window was full need to be considered further
+        pending = np.zeros(size, dtype=bool)
+        pending[o[full]] = True
+        keep = pending[owner] & (col >= base + 63)
+        owner, col = owner[keep], col[keep]
+    return free
+
+
+def _jones_plassmann(G):
+    # Jones-Plassmann algorithm for graph coloring. Each node is given a
+    # random priority, and a node is colored once all of its neighbors with
+    # higher priorities have been colored, using the lowest color label not
+    # used by these neighbors. This gives the same solution as the greedy
+    # algorithm with nodes considered in decreasing order of priority, but
+    # the nodes colored at each step form an independent set S, allowing all
+    # of them to be processed together using vectorized operations. For each
+    # node v, cnt[v] gives the number of uncolored neighbors of v with higher
+    # priorities, so that each edge is considered a constant number of times
+    n = len(G)
+    indptr = np.frombuffer(G.indptr, dtype=G.indptr.typecode)
+    indices = np.frombuffer(G.indices, dtype=G.indices.typecode)
+    deg = np.diff(indptr)
+    prio = np.random.default_rng(random.getrandbits(64)).permutation(n)
+    u = np.repeat(np.arange(n), deg)
+    cnt = np.bincount(u[prio[indices] > prio[u]], minlength=n)
+    c = np.full(n, -1)
+    S = np.flatnonzero(cnt == 0)
+    while len(S) > 0:
+        # Gather the neighbors of each node in S. Neighbors with higher
+        # priorities are already colored, so the lowest color label not used
+        # by these is assigned
+        k = deg[S]
+        owner = np.repeat(np.arange(len(S)), k)
+        start = np.repeat(indptr[S] - np.cumsum(k) + k, k)
+        N = indices[start + np.arange(len(owner))]
+        higher = prio[N] > prio[S][owner]
+        c[S] = _lowestfree(owner[higher], c[N[higher]], len(S))
+        # Update the counts of the neighbors with lower priorities. Those with
+        # no remaining higher-priority uncolored neighbors form the next S
+        N = N[~higher]
+        np.subtract.at(cnt, N, 1)
+        S = np.unique(N[cnt[N] == 0])
+    return c.tolist()
+
+
+def _portfoliomember(G, strategy, seed):
+    # Makes a coloring of G using a single strategy of the portfolio in a
+    # worker process. Each worker is seeded separately so that the random
+    # strategies give different orderings
+    random.seed(seed)
+    return _initialcoloring(G, strategy)
+
+
+def _portfolio(G, deadline=None):
+    # Runs a portfolio of constructive strategies on G and returns the
+    # coloring using the fewest colors. For larger graphs, the strategies are
+    # run concurrently in a pool of worker processes. If a deadline is given,
+    # the best coloring produced before this deadline is returned, and any
+    # unfinished strategies are abandoned. A coloring is first made in this
+    # process using the linear-time smallest-last strategy, so that a
+    # solution is always available
+    members = [
+        ("random", random.getrandbits(32)),
+        ("random", random.getrandbits(32)),
+        ("random", random.getrandbits(32)),
+        ("welsh_powell", None),
+        ("dsatur", None),
+        ("rlf", None),
+    ]
+    best = _initialcoloring(G, "smallest_last")
+    processes = min(len(members), multiprocessing.cpu_count())
+    if len(G.indices) < 20000 or (processes == 1 and deadline is None):
+        # For small graphs (or when only one processor is available), the
+        # overheads of starting processes outweigh the benefits, so the
+        # strategies are run in turn
+        results = []
+        for strategy, seed in members:
+            if _timeup(deadline):
+                break
+            results.append(_initialcoloring(G, strategy))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            jobs = [
+                pool.apply_async(_portfoliomember, (G, strategy, seed))
+                for strategy, seed in members
+            ]
+            for job in jobs:
+                if deadline is None:
+                    job.wait()
+                else:
+                    job.wait(max(0, deadline - time.monotonic()))
+            results = [job.get() for job in jobs if job.ready()]
+    for c in results:
+        if max(c) < max(best):
+            best = c
+    return best
+
+
+def _initialcoloring(G, strategy, deadline=None):
+    # Makes an initial coloring of G using the chosen constructive strategy.
+    # For dense graphs of moderate size, versions of the algorithms that use
+    # rows of the adjacency matrix as bitsets are used
+    if strategy == "portfolio":
+        return _portfolio(G, deadline)
+    dense = len(G) <= 10000 and G.density() >= 0.1
+    if strategy == "random":
+        V = list(G)
+        random.shuffle(V)
+        if dense:
+            return _greedy_dense(G, V)
+        return _greedy(G, V)
+    elif strategy == "welsh_powell":
+        V = sorted(G, key=G.degree, reverse=True)
+        if dense:
+            return _greedy_dense(G, V)
+        return _greedy(G, V)
+    elif strategy == "smallest_last":
+        V, _ = _smallestlast(G)
+        if dense:
+            return _greedy_dense(G, V)
+        return _greedy(G, V)
+    elif strategy == "jones_plassmann":
+        return _jones_plassmann(G)
+    elif strategy == "rlf":
+        if dense:
+            return _rlf_dense(G)
+        return _rlf(G)
+    else:
+        if dense:
+            return _dsatur_dense(G)
+        return _dsatur(G)
+
+
+def _greedyclique(G):
+    # Returns a large clique of G. A clique is grown from each node u in turn
+    # by repeatedly adding the candidate of highest degree, where the
+    # candidates are the nodes adjacent to all members of the clique. Nodes
+    # whose degree is too low to improve on the best clique are skipped
+    best = []
+    for u in sorted(G, key=G.degree, reverse=True):
+        if G.degree(u) < len(best):
+            break
+        C, cand = [u], set(G[u])
+        while cand:
+            v = max(cand, key=G.degree)
+            C.append(v)
+            cand.intersection_update(G[v])
+        if len(C) > len(best):
+            best = C
+    return best
+
+
+def _backtrackcol(G, targetcols, verbose, deadline=None, init=None):
+    # Exact backtracking algorithm for node coloring. Nodes outside of the
+    # targetcols-core of G are removed and colored afterwards. If G is
+    # disconnected, each component is colored separately. A component is only
+    # passed to the backtracking algorithm if DSatur does not color it using
+    # at most the target number of colors. The search starts with an upper
+    # bound given by an incumbent solution, which is the better of DSatur and
+    # init (an optional initial coloring of G), improved by a short run of
+    # TabuCol (at most 10000 iterations and one second, so that its cost does
+    # not grow with the size of G). If the deadline passes, the best solution
+    # found so far is returned
+    P = _peel(G, targetcols)
+    if P:
+        def solvecore(H, V, target):
+            cH = None if init is None else _restrictcoloring(init, V)
+            return _backtrackcol(H, target, verbose, deadline, cH)
+
+        return _solvecore(G, P, targetcols, solvecore)
+    comps = G.components()
+    if len(comps) > 1:
+        def solve(H, V, target):
+            c = _dsatur(H)
+            if init is not None:
+                cH = _restrictcoloring(init, V)
+                if max(cH) < max(c):
+                    c = cH
+            if max(c) + 1 <= target:
+                return c
+            return _backtrackcol(H, target, verbose, deadline, c)
+
+        return _solvecomponents(G, comps, targetcols, solve)
+    C = _greedyclique(G)
     targetcols = max(targetcols, len(C))
-    k, its, bestc = len(G), 0, {}
+    bestc = _dsatur(G)
+    if init is not None and max(init) < max(bestc):
+        bestc = list(init)
+    if max(bestc) + 1 > targetcols:
+        warm = _getdeadline(1)
+        if deadline is not None:
+            warm = min(warm, deadline)
+        bestc = _localsearchcol(
+            G, list(bestc), targetcols, None, 2, min(10 * len(G), 10000), 0,
+            warm
+        )[0]
+    # The search is iterative and uses bitsets. Nodes are ranked by
+    # decreasing degree, with node u represented by the bit bit[u] = 1 << r,
+    # where r is its rank. level[s] is a bitset of the uncolored nodes with
+    # saturation degree s, and free is a bitset of all uncolored nodes, so the
+    # DSatur choice (with ties broken by degree) is the lowest bit of the
+    # highest nonempty level. c holds the colors of the nodes (-1 if
+    # uncolored), forbid[v] is a bitset of the colors adjacent to the
+    # uncolored node v, and sat[v] is its size. When a node is colored, the
+    # uncolored neighbors whose bitsets gain the color are appended to the
+    # trail, so that the assignment can be undone exactly. Bitsets of the
+    # neighbors of each node are also made, for use in pruning. These need up
+    # to n * n bits, so they are only made if this is at most 8 MB or no more
+    # than the memory used by the CSR arrays of G
+    n = len(G)
+    rank = sorted(G, key=G.degree, reverse=True)
+    bit = [0 for u in G]
+    for r in range(n):
+        bit[rank[r]] = 1 << r
+    c, forbid, sat = [-1 for u in G], [0 for u in G], [0 for u in G]
+    level = [0 for s in range(n + 1)]
+    level[0] = free = (1 << n) - 1
+    trail, ncols, adj = [], 0, None
+    if n <= 8192 or n * n <= 32 * (len(G.indices) + n):
+        adj = [sum(bit[v] for v in G[u]) for u in G]
+
+    def assign(u, i):
+        # Assign node u to color i and update the data structures
+        nonlocal ncols, free
+        c[u] = i
+        ncols = max(ncols, i + 1)
+        level[sat[u]] ^= bit[u]
+        free ^= bit[u]
+        b = 1 << i
+        for v in G[u]:
+            if c[v] == -1 and not forbid[v] & b:
+                forbid[v] |= b
+                level[sat[v]] ^= bit[v]
+                sat[v] += 1
+                level[sat[v]] |= bit[v]
+                trail.append(v)
+
+    def unassign(u, mark, cols):
+        # Undo the assignment of node u, where the trail had length mark and
+        # cols colors were being used beforehand
+        nonlocal ncols, free
+        b = 1 << c[u]
+        c[u], ncols = -1, cols
+        while len(trail) > mark:
+            v = trail.pop()
+            forbid[v] ^= b
+            level[sat[v]] ^= bit[v]
+            sat[v] -= 1
+            level[sat[v]] |= bit[v]
+        level[sat[u]] |= bit[u]
+        free |= bit[u]
+
+    def highest(X):
+        # Returns the node in the bitset X of highest saturation degree,
+        # breaking ties by degree
+        for s in range(ncols, -1, -1):
+            Y = X & level[s]
+            if Y:
+                return rank[(Y & -Y).bit_length() - 1]
+
+    def pruned(u):
+        # Returns True if the current partial coloring cannot be extended
+        # using at most k colors, as shown by a lower bound. Here, u is the
+        # uncolored node of highest saturation degree. A clique K of uncolored
+        # nodes is grown from u, adding the candidate of highest saturation
+        # degree at each step. Each node v of K must be given a different
+        # color from A(v), its set of colors below k that are not adjacent to
+        # it, so by Hall's theorem, no t nodes of K can have fewer than t
+        # colors in the union of their sets. This is tested for the nodes
+        # with the smallest sets. Since no set is smaller than A(u), the test
+        # can only fail if K has more than |A(u)| = k - sat[u] nodes
+        K, cand = [u], adj[u] & free
+        if sat[u] + bin(cand).count("1") < k:
+            return False
+        while cand:
+            v = highest(cand)
+            K.append(v)
+            cand &= adj[v]
+        if sat[u] + len(K) <= k:
+            return False
+        mask = (1 << k) - 1
+        A = sorted((~forbid[v] & mask for v in K),
+                   key=lambda a: bin(a).count("1"))
+        union = 0
+        for t in range(len(A)):
+            union |= A[t]
+            if bin(union).count("1") <= t:
+                return True
+        return False
 
-    def color(u):
-        # Recursive function used for backtracking. Attempts to color node u
-        nonlocal its, k
-        its += 1
-        if len(S) == len(G):
+    if verbose > 0:
+        print("Running backtracking algorithm:")
+    for i in range(len(C)):
+        assign(C[i], i)
+    # Each entry of the stack holds a node u chosen by the search, the color
+    # it is currently assigned (-1 if none), and the trail length and number
+    # of colors before this assignment. Only colors below k are permitted, so
+    # entries where more than k colors are already in use are backtracked.
+    # Also, u is only given a new color if no lower unused colors exist
+    k, its, timedout, stack = max(bestc), 0, False, []
+    if verbose > 0:
+        print("    Found solution with", k + 1,
+              "colors. Total backtracking iterations = 0")
+    while k >= targetcols:
+        if free:
+            # Choose the next node, unless the partial coloring is pruned
+            u = highest(free)
+            if adj is None or not pruned(u):
+                stack.append([u, -1, len(trail), ncols])
+        else:
             # A new best solution has been found.
-            for v in G:
-                bestc[v] = S.currentNodeCol(v)
+            bestc = list(c)
             if verbose > 0:
-                print("    Found solution with", S.numCols(),
+                print("    Found solution with", ncols,
                       "colors. Total backtracking iterations =", its)
-            if S.numCols() == targetcols:
-                return True
-            else:
-                # Reduce the number of available colors and continue
-                k = S.numCols() - 1
-                return False
-        i = 0
-        while True:
-            if i >= k or S.numCols() > k:
-                # Using too many colors or have tried all available colors
+            if ncols <= targetcols:
                 break
-            elif S.nodeFeasibleForCol(u, i):
-                S.assignNodeToCol(G, u, i)
-                v = S.getNextNode()
-                if color(v):
-                    return True
-                S.unassignNodeFromCol(G, u)
+            # Reduce the number of available colors and continue
+            k = ncols - 1
+        # Assign the next feasible color to the node on top of the stack,
+        # backtracking when all colors have been tried
+        while stack:
+            entry = stack[-1]
+            u, i, mark, cols = entry
+            if i >= 0:
+                unassign(u, mark, cols)
             i += 1
-        return False
-
-    if verbose > 0:
-        print("Running backtracking algorithm:")
-    S = _Coloring(G, C)
-    u = S.getNextNode()
-    color(u)
+            while i <= cols and forbid[u] >> i & 1:
+                i += 1
+            if i < k and i <= cols <= k:
+                entry[1] = i
+                assign(u, i)
+                break
+            stack.pop()
+        else:
+            # The search has backtracked to the root
+            break
+        its += 1
+        if its % 1000 == 0 and _timeup(deadline):
+            timedout = True
+            break
     if verbose > 0:
-        print("Ending backtracking at iteration",
-              its, "- optimal solution achieved.")
+        if timedout:
+            print("Ending backtracking at iteration", its,
+                  "- time limit has been reached.")
+        else:
+            print("Ending backtracking at iteration",
+                  its, "- optimal solution achieved.")
     return bestc
 
 
-def _partialcol(G, k, c, W, it_limit, verbose):
+def _partialcol(G, k, c, W, it_limit, verbose, deadline=None, bestk=None,
+                chk=None):
     def domovepartialcol(v, j):
         # Used by partialcol to move node v to color j and update relevant
-        # data structures
+        # data structures. Only the moves of uncolored nodes adjacent to
+        # nodes that change color are re-keyed in Q
         c[v] = j
         U.remove(v)
+        for i in range(k):
+            Q.remove(v * k + i)
         for u in G[v]:
-            C[u, j] += W[v]
-            if c[u] == j:
-                T[u, j] = its + t
+            C[u][j] += W[v]
+            if c[u] == -1:
+                Q.update(u * k + j, C[u][j] - W[u])
+            elif c[u] == j:
+                T[u][j] = its + t
                 U.add(u)
                 c[u] = -1
                 for w in G[u]:
-                    C[w, j] -= W[u]
-
-    # Use the current solution c to populate the data structures. C[v,j] gives
-    # the total weight of the neighbors of v in color j, T is the tabu list,
-    # and U is the set of clashing nodes
+                    C[w][j] -= W[u]
+                    if c[w] == -1:
+                        Q.update(w * k + j, C[w][j] - W[w])
+                for i in range(k):
+                    Q.add(u * k + i, C[u][i] - W[u])
+
+    def istabu(e):
+        # Returns True iff the move e (of node e // k to color e % k) is tabu
+        return T[e // k][e % k] >= its
+
+    # Use the current solution c to populate the data structures. C[v][j]
+    # gives the total weight of the neighbors of v in color j, T is the tabu
+    # list, and U is the set of uncolored nodes. Q holds the moves of each
+    # uncolored node v to each color j, identified by v * k + j and keyed by
+    # the resultant change in cost C[v][j] - W[v]
     assert k >= 1, "Error, partialcol only works with at least k = 1 color"
-    C, T, U, its = {}, {}, set(), 0
+    U, its = set(), 0
     for v in G:
         assert (
             isinstance(c[v], int) and c[v] >= -1 and c[v] < k
         ), ("Error, the coloring defined by c must allocate each node a ",
             "value from the set {-1,0,...,k-1}, where -1 signifies that ",
             "a node is uncolored")
-        for j in range(k):
-            C[v, j] = 0
-            T[v, j] = 0
+    C = [[0 for j in range(k)] for v in G]
+    T = [[0 for j in range(k)] for v in G]
     for v in G:
         if c[v] == -1:
             U.add(v)
         for u in G[v]:
             if c[u] != -1:
-                C[v, c[u]] += W[u]
+                C[v][c[u]] += W[u]
+    Q = _MoveBuckets()
+    for v in U:
+        for j in range(k):
+            Q.add(v * k + j, C[v][j] - W[v])
     currentcost = sum(W[u] for u in U)
-    bestcost, bestsol, t = float("inf"), {}, 1
+    bestcost, bestsol, t = float("inf"), [], 1
+    state = chk.restore() if chk is not None else None
+    if state is not None:
+        c, U, C, T, Q = state["c"], set(state["U"]), state["C"], state["T"], \
+            state["Q"]
+        its, currentcost, bestcost, bestsol, t = state["its"], \
+            state["currentcost"], state["bestcost"], state["bestsol"], \
+            state["t"]
     if verbose > 0:
         print("    Running PartialCol algorithm using", k, "colors")
     while True:
@@ -585,30 +1543,27 @@ def _partialcol(G, k, c, W, it_limit, verbose):
                 print("        Solution with", k, "colors and cost",
                       currentcost, "found by PartialCol at iteration", its)
             bestcost = currentcost
-            bestsol = dict(c)
+            bestsol = list(c)
         if bestcost <= 0 or its >= it_limit:
             break
-        # Evaluate all neighbors of current solution c
+        if its % 100 == 0 and (_timeup(deadline) or _beaten(bestk, k)):
+            break
+        if its % 100 == 0 and chk is not None and chk.due():
+            chk.update({"c": c, "U": sorted(U), "C": C, "T": T, "Q": Q,
+                        "its": its, "currentcost": currentcost,
+                        "bestcost": bestcost, "bestsol": bestsol, "t": t})
+        # Choose a best move that is not tabu, or that leads to a new best
+        # solution. If all moves are tabu, choose a random move. (U is sorted
+        # here so that resumed searches make the same choices)
         its += 1
-        vbest, jbest, bestval, numbestval = -1, -1, float("inf"), 0
-        for v in U:
-            for j in range(k):
-                neighborcost = currentcost + C[v, j] - W[v]
-                if neighborcost <= bestval:
-                    if neighborcost < bestval:
-                        numbestval = 0
-                    # Consider the move if it is not tabu or leads to a new
-                    # best solution
-                    if T[v, j] < its or neighborcost < bestcost:
-                        if random.randint(0, numbestval) == 0:
-                            vbest, jbest, bestval = v, j, neighborcost
-                        numbestval += 1
-        # Do the chosen move. If no move was chosen (all moves are tabu),
-        # choose a random move
-        if vbest == -1:
-            vbest = random.choice(tuple(U))
+        move = Q.choose(bestcost - currentcost, istabu)
+        if move is None:
+            vbest = random.choice(sorted(U))
             jbest = random.randint(0, k - 1)
-            bestval = currentcost + C[vbest, jbest] - W[vbest]
+            bestval = currentcost + C[vbest][jbest] - W[vbest]
+        else:
+            vbest, jbest = divmod(move[0], k)
+            bestval = currentcost + move[1]
         # Apply the move, update T, and determine the next tabu tenure t
         domovepartialcol(vbest, jbest)
         currentcost = bestval
@@ -618,30 +1573,162 @@ def _partialcol(G, k, c, W, it_limit, verbose):
     return bestcost, bestsol, its
 
 
-def _tabucol(G, k, c, W, it_limit, verbose):
+def _ilsMIS(G, S, W, it_limit, verbose, deadline=None):
+    def flip(v):
+        # Moves node v into or out of the solution, updating the tightness of
+        # its neighbors and the solution weight
+        nonlocal current
+        d = -1 if inS[v] else 1
+        inS[v] = not inS[v]
+        current += d * W[v]
+        for u in G[v]:
+            tau[u] += d
+            sw[u] += d * W[v]
+
+    def add(v):
+        # Puts node v into the solution
+        flip(v)
+        log.append(v)
+        push(v)
+
+    def drop(v):
+        # Takes node v out of the solution. Its neighbors may now be free or
+        # 1-tight, so they are queued
+        flip(v)
+        log.append(v)
+        for u in G[v]:
+            push(u)
+
+    def push(v):
+        if not queued[v]:
+            queued[v] = True
+            Q.append(v)
+
+    def twoswap(x):
+        # Looks for a (1,2)-swap, which takes node x out of the solution and
+        # puts in two nonadjacent neighbors u and v of x whose only neighbor
+        # in the solution is x, such that W[u] + W[v] > W[x]. Candidates are
+        # tried in order of decreasing weight
+        L = sorted((u for u in G[x] if tau[u] == 1), key=lambda u: -W[u])
+        for a in range(len(L) - 1):
+            u = L[a]
+            if W[u] + W[L[a + 1]] <= W[x]:
+                return
+            Nu = set(G[u])
+            for v in L[a + 1:]:
+                if W[u] + W[v] <= W[x]:
+                    break
+                if v not in Nu:
+                    drop(x)
+                    add(u)
+                    add(v)
+                    return
+
+    def localsearch():
+        # Applies improving moves until the queue is empty. A node v outside
+        # the solution is put in, and its neighbors taken out, if W[v] exceeds
+        # the weight sw[v] of its neighbors in the solution (an (w,1)-swap,
+        # which includes the insertion of free nodes). If instead v is
+        # 1-tight, its neighbor in the solution is queued so that (1,2)-swaps
+        # are checked. The node forced in by the perturbation is not removed
+        while Q:
+            v = Q.popleft()
+            queued[v] = False
+            if inS[v]:
+                if v != forced:
+                    twoswap(v)
+            elif W[v] > sw[v]:
+                N = [u for u in G[v] if inS[u]]
+                if forced not in N:
+                    for u in N:
+                        drop(u)
+                    add(v)
+            elif tau[v] == 1:
+                for u in G[v]:
+                    if inS[u]:
+                        push(u)
+                        break
+
+    # Iterated local search of Andrade, Resende and Werneck, extended to node
+    # weights. inS[v] is True iff node v is in the solution, tau[v] is the
+    # number of neighbors of v in the solution, and sw[v] is their total
+    # weight. Only nodes whose tightness changes are queued for the local
+    # search, so each move takes time proportional to the degrees of the nodes
+    # involved. In each iteration, a random node outside the solution is
+    # forced in, and the local search is applied. The new solution is kept if
+    # it is no worse; otherwise, it is kept with probability 1 / (1 + d * e),
+    # where d and e are its distances from the previous and best solutions,
+    # measured in mean node weights. Rejected iterations are undone using log,
+    # the sequence of nodes that changed state. The best solution is copied
+    # only when the search is about to leave it
+    n = len(G)
+    inS = [False for v in G]
+    tau, sw = [0 for v in G], [0 for v in G]
+    queued = [False for v in G]
+    Q, log, forced, current = deque(), [], None, 0
+    for v in S:
+        flip(v)
+    for v in G:
+        push(v)
+    localsearch()
+    its, best, bestsol, unit = 0, current, None, sum(W) / n
+    if verbose > 0:
+        print("    Running ILS algorithm")
+        print("        Solution with cost", sum(W) - best,
+              "found by ILS at iteration", its)
+    while its < it_limit:
+        if its % 100 == 0 and _timeup(deadline):
+            break
+        if current == best and bestsol is None:
+            bestsol = [v for v in G if inS[v]]
+            if len(bestsol) == n:
+                break
+        # Force a random node outside the solution into it, and reoptimize
+        its += 1
+        previous = current
+        log.clear()
+        forced = random.randrange(n)
+        while inS[forced]:
+            forced = random.randrange(n)
+        for u in G[forced]:
+            if inS[u]:
+                drop(u)
+        add(forced)
+        localsearch()
+        if current > best:
+            best, bestsol = current, None
+            if verbose > 0:
+                print("        Solution with cost", sum(W) - best,
+                      "found by ILS at iteration", its)
+        elif current < previous:
+            d, e = (previous - current) / unit, (best - current) / unit
+            if random.random() >= 1 / (1 + d * e):
+                for v in reversed(log):
+                    flip(v)
+    if bestsol is None:
+        bestsol = [v for v in G if inS[v]]
+    if verbose > 0:
+        print("    Ending ILS")
+    return sum(W) - best, bestsol, its
+
+
+def _tabucol(G, k, c, W, it_limit, verbose, deadline=None, bestk=None,
+             chk=None):
     def domovetabucol(v, j):
         # Used by tabucol to move node v to a new color j and update relevant
-        # data structures
+        # data structures. The neighbors of v and the weights of the edges to
+        # them are given by slices of the CSR arrays
         i = c[v]
         c[v] = j
-        if C[v, i] > 0 and C[v, j] == 0:
-            U.remove(v)
-        elif C[v, i] == 0 and C[v, j] > 0:
-            U.add(v)
-        for u in G[v]:
-            C[u, i] -= W[v, u]
-            if C[u, i] == 0 and c[u] == i:
-                U.remove(u)
-            C[u, j] += W[v, u]
-            if C[u, j] > 0 and c[u] == j:
-                U.add(u)
+        N = indices[indptr[v]:indptr[v + 1]]
+        Wv = 1 if W is None else W[indptr[v]:indptr[v + 1]]
+        C[N, i] -= Wv
+        C[N, j] += Wv
+        clash[N] = C[N, c[N]] > 0
+        clash[v] = C[v, j] > 0
         T[v, i] = its + t
 
     assert k >= 2, "Error, tabucol only works with at least k = 2 colors"
-    # Use the current solution c to populate the data structures. C[v,j] gives
-    # the number of neighbors of v in color j, T is the tabu list, and U is the
-    # set of clashing nodes
-    C, T, U, its, currentcost = {}, {}, set(), 0, 0
     for v in G:
         assert isinstance(c[v], int) and c[v] >= 0 and c[v] < k, (
             "Error, the coloring defined by c must allocate each node a ",
@@ -650,18 +1737,38 @@ def _tabucol(G, k, c, W, it_limit, verbose):
             + " "
             + str(c[v])
         )
-        for j in range(k):
-            C[v, j] = 0
-            T[v, j] = 0
-    for v in G:
-        for u in G[v]:
-            C[v, c[u]] += W[v, u]
-    for v in G:
-        if C[v, c[v]] > 0:
-            currentcost += C[v, c[v]]
-            U.add(v)
-    currentcost //= 2
-    bestcost, bestsol, t = float("inf"), {}, 1
+    # Use the current solution c to populate the data structures. These are
+    # NumPy arrays, where C[v, j] gives the total weight of the edges from v
+    # to nodes of color j; T is the tabu list, holding the iteration at which
+    # each move stops being tabu (so it is int64 to allow any it_limit); and
+    # clash[v] is True iff v is a clashing node. W[e] is the weight of the eth
+    # edge in the CSR arrays indptr and indices, as given by _getEdgeWeights,
+    # or None if all edges have a weight of 1
+    n = len(G)
+    indptr = np.frombuffer(G.indptr, dtype=G.indptr.typecode)
+    indices = np.frombuffer(G.indices, dtype=G.indices.typecode)
+    dtype = np.int64 if W is None else W.dtype
+    if dtype == np.float64:
+        tonum, maxval = float, np.inf
+    elif dtype == np.int64:
+        tonum, maxval = int, np.iinfo(np.int64).max
+    else:
+        tonum, maxval = int, float("inf")
+    c = np.array(c, dtype=np.int64)
+    C = np.zeros((n, k), dtype=dtype)
+    np.add.at(C, (np.repeat(np.arange(n), np.diff(indptr)), c[indices]),
+              1 if W is None else W)
+    T = np.zeros((n, k), dtype=np.int64)
+    clash = C[np.arange(n), c] > 0
+    currentcost = tonum(C[np.arange(n), c].sum())
+    currentcost = currentcost // 2 if tonum is int else currentcost / 2
+    its, bestcost, bestsol, t = 0, float("inf"), [], 1
+    state = chk.restore() if chk is not None else None
+    if state is not None:
+        c, C, T, clash = state["c"], state["C"], state["T"], state["clash"]
+        its, currentcost, bestcost, bestsol, t = state["its"], \
+            state["currentcost"], state["bestcost"], state["bestsol"], \
+            state["t"]
     if verbose > 0:
         print("    Running TabuCol algorithm using", k, "colors")
     while True:
@@ -671,83 +1778,106 @@ def _tabucol(G, k, c, W, it_limit, verbose):
                 print("        Solution with", k, "colors and cost",
                       currentcost, "found by TabuCol at iteration", its)
             bestcost = currentcost
-            bestsol = dict(c)
+            bestsol = c.copy()
         if bestcost <= 0 or its >= it_limit:
             break
-        # Evaluate all neighbors of current solution
+        if its % 100 == 0 and (_timeup(deadline) or _beaten(bestk, k)):
+            break
+        if its % 100 == 0 and chk is not None and chk.due():
+            chk.update({"c": c, "C": C, "T": T, "clash": clash, "its": its,
+                        "currentcost": currentcost, "bestcost": bestcost,
+                        "bestsol": bestsol, "t": t})
+        # Evaluate all neighbors of current solution. Here, delta[r, j] is the
+        # change in cost from moving the rth clashing node to color j. Moves
+        # that are tabu (and do not lead to a new global best) are masked
         its += 1
-        vbest, jbest, bestval, numbestval = -1, -1, float("inf"), 0
-        for v in U:
-            for j in range(k):
-                if j != c[v]:
-                    neighborcost = currentcost + C[v, j] - C[v, c[v]]
-                    if neighborcost <= bestval:
-                        if neighborcost < bestval:
-                            numbestval = 0
-                        # Consider the move if it is not tabu or leads to a new
-                        # global best
-                        if T[v, j] < its or neighborcost < bestcost:
-                            if random.randint(0, numbestval) == 0:
-                                vbest, jbest, bestval = v, j, neighborcost
-                            numbestval += 1
-        # Do the chosen move. If no move was chosen (all moves are tabu),
-        # choose a random move
-        if vbest == -1:
-            vbest = random.choice(tuple(c))
+        U = np.flatnonzero(clash)
+        r = np.arange(len(U))
+        delta = C[U]
+        delta -= delta[r, c[U]][:, None]
+        allowed = (T[U] < its) | (delta < bestcost - currentcost)
+        allowed[r, c[U]] = False
+        if allowed.any():
+            # Choose a best move, breaking ties randomly
+            delta[~allowed] = maxval
+            best = np.flatnonzero(delta == delta.min())
+            e = best[random.randrange(len(best))]
+            vbest, jbest = U[e // k], e % k
+            bestval = currentcost + tonum(delta[e // k, jbest])
+        else:
+            # All moves are tabu, so choose a random move
+            vbest = random.randrange(len(G))
             while True:
                 jbest = random.randint(0, k - 1)
                 if jbest != c[vbest]:
                     break
-            bestval = currentcost + C[vbest, jbest] - C[vbest, c[vbest]]
+            bestval = currentcost + tonum(
+                C[vbest, jbest] - C[vbest, c[vbest]]
+            )
         domovetabucol(vbest, jbest)
         currentcost = bestval
-        t = int(0.6 * len(U)) + random.randint(0, 9)
+        t = int(0.6 * np.count_nonzero(clash)) + random.randint(0, 9)
     if verbose > 0:
         print("    Ending TabuCol")
-    return bestcost, bestsol, its
+    return bestcost, bestsol.tolist(), its
 
 
-def _HEA(G, k, c, W, it_limit, verbose, doTabuCol):
+def _HEA(G, k, c, W, it_limit, verbose, doTabuCol, deadline=None,
+         island=None, chk=None):
+    def partition(P):
+        # Used in GPX recombination operator. Returns the nodes of the
+        # solution P sorted by color, the position in this array at which
+        # each color class starts, and an array holding the class sizes
+        sizes = np.bincount(P[P >= 0], minlength=k)
+        start = np.concatenate(([0], sizes.cumsum())) + len(P) - sizes.sum()
+        return np.argsort(P, kind="stable"), start, sizes
+
     def choosecolor(S):
         # Used in GPX recombination operator. Returns the index of the largest
-        # set (color class) in the partition S, breaking ties randomly
-        maxCard, A = 0, []
-        for i in range(len(S)):
-            if len(S[i]) > 0:
-                if len(S[i]) > maxCard:
-                    A.clear()
-                    A.append(i)
-                    maxCard = len(S[i])
-                elif len(S[i]) == maxCard:
-                    A.append(i)
-        if len(A) == 0:
+        # color class in the partition S, breaking ties randomly, or -1 if
+        # all classes are empty
+        maxCard = S[2].max()
+        if maxCard == 0:
             return -1
-        else:
-            return random.choice(A)
+        A = np.flatnonzero(S[2] == maxCard)
+        return A[random.randrange(len(A))].item()
 
     def colornodes(off, i, col, P1, S1, P2, S2):
         # Used in GPX recombination operator. Removes color class col from P1
         # and S1, the same nodes from P2 and S2, and, in off, assigns these
-        # nodes to color i
-        for u in S1[col]:
-            P1[u] = -1
-            if P2[u] != -1:
-                S2[P2[u]].remove(u)
-                P2[u] = -1
-            off[u] = i
-        S1[col].clear()
+        # nodes to color i. Nodes of the class that were removed earlier
+        # (because they were taken from the other parent) are skipped
+        V = S1[0][S1[1][col]:S1[1][col + 1]]
+        V = V[P1[V] == col]
+        off[V] = i
+        P1[V] = -1
+        S1[2][col] = 0
+        cols = P2[V]
+        S2[2][:] -= np.bincount(cols[cols >= 0], minlength=k)
+        P2[V] = -1
+
+    def migrate():
+        # Used in the island model. Sends a copy of the best individual in
+        # the population to the next island, and replaces the weakest
+        # individuals with any better ones received from the previous island
+        best = min(range(popsize), key=lambda j: popcost[j])
+        outbox.put((popcost[best], list(pop[best])))
+        while True:
+            try:
+                cost, sol = inbox.get_nowait()
+            except queue.Empty:
+                break
+            worst = max(range(popsize), key=lambda j: popcost[j])
+            if cost < popcost[worst]:
+                pop[worst], popcost[worst] = sol, cost
 
     def GPX(parent1, parent2):
-        # Makes copies (P1 and P2) of the two parents, creates corresponding
-        # partitons S1 and S2, and uses these to create the offspring off
-        P1, P2 = dict(parent1), dict(parent2)
-        S1, S2 = [set() for i in range(k)], [set() for i in range(k)]
-        off = {u: -1 for u in G}
-        for u in G:
-            if P1[u] != -1:
-                S1[P1[u]].add(u)
-            if P2[u] != -1:
-                S2[P2[u]].add(u)
+        # Makes array copies (P1 and P2) of the two parents, creates
+        # corresponding partitions S1 and S2, and uses these to create the
+        # offspring off
+        P1, P2 = np.array(parent1), np.array(parent2)
+        S1, S2 = partition(P1), partition(P2)
+        off = np.full(len(G), -1)
         for i in range(k):
             if i % 2 == 0:
                 # Copy a color class from first parent to the offspring
@@ -759,9 +1889,10 @@ def _HEA(G, k, c, W, it_limit, verbose, doTabuCol):
                 col = choosecolor(S2)
                 if col != -1:
                     colornodes(off, i, col, P2, S2, P1, S1)
+        off = off.tolist()
         if doTabuCol:
             # Assign any remaining uncolored nodes randomly
-            for u in P1:
+            for u in G:
                 if off[u] == -1:
                     off[u] = random.randint(0, k - 1)
         return off
@@ -784,54 +1915,82 @@ def _HEA(G, k, c, W, it_limit, verbose, doTabuCol):
                 "value from the set {-1,0,...,k-1}, where -1 signifies that ",
                 "a node is uncolored")
     popsize, itsperindv, totalits = min(10, len(G)), 16 * len(G), 0
-    bestcost, bestsol = float("inf"), {}
-    # Create the initial population. The first individual is found by applying
-    # local search to c; the remainder by applying dsatur with a randomly
-    # selected initial node, then applying local search.
-    if verbose > 0:
-        print("    Making HEA initial solution 1 using", k, "colors")
-    if doTabuCol:
-        cost, c, its = _tabucol(G, k, c, W, min(
-            itsperindv, it_limit - totalits), verbose)
+    bestcost, bestsol = float("inf"), []
+    # If this population is an island of _islandHEA, bestk holds the fewest
+    # colors for which any island has found a solution, and individuals are
+    # exchanged with the neighboring islands every interval offspring
+    bestk, inbox, outbox, interval = island or (None, None, None, None)
+    # If a checkpointed search is being resumed, the population is restored
+    # and the search continues from the individual being made when it was
+    # saved. The state is saved between individuals
+    state = chk.restore() if chk is not None else None
+    if state is not None:
+        pop, popcost, bestcost, bestsol, totalits, randomnodes, i = (
+            state["pop"], state["popcost"], state["bestcost"],
+            state["bestsol"], state["totalits"], state["randomnodes"],
+            state["i"])
     else:
-        cost, c, its = _partialcol(G, k, c, W, min(
-            itsperindv, it_limit - totalits), verbose)
-    totalits += its
-    if cost < bestcost:
-        bestcost, bestsol = cost, dict(c)
-    if cost == 0 or totalits >= it_limit:
-        return bestcost, bestsol, totalits
-    pop, popcost = [c], [cost]
-    randomnodes = random.sample(list(G.nodes), popsize - 1)
-    for i in range(0, popsize - 1):
+        # Create the initial population. The first individual is found by
+        # applying local search to c; the remainder by applying dsatur with a
+        # randomly selected initial node, then applying local search.
+        if verbose > 0:
+            print("    Making HEA initial solution 1 using", k, "colors")
+        if doTabuCol:
+            cost, c, its = _tabucol(G, k, c, W, min(
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
+        else:
+            cost, c, its = _partialcol(G, k, c, W, min(
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
+        totalits += its
+        if cost < bestcost:
+            bestcost, bestsol = cost, list(c)
+        if (cost == 0 or totalits >= it_limit or _timeup(deadline)
+                or _beaten(bestk, k)):
+            return bestcost, bestsol, totalits
+        pop, popcost = [c], [cost]
+        randomnodes = random.sample(range(len(G)), popsize - 1)
+        i = 1
+
+    def save():
+        # Used to checkpoint the state of the HEA between individuals
+        if chk is not None and chk.due():
+            chk.update({"pop": pop, "popcost": popcost, "bestcost": bestcost,
+                        "bestsol": bestsol, "totalits": totalits,
+                        "randomnodes": randomnodes, "i": i})
+
+    for i in range(len(pop) - 1, popsize - 1):
+        save()
         if verbose > 0:
             print("    Making HEA initial solution", i + 2,
                   "using", k, "colors")
         sol = {randomnodes[i]: 0}
         sol = _dsatur(G, sol)
         if doTabuCol:
-            for u in sol:
+            for u in G:
                 if sol[u] >= k:
                     sol[u] = random.randint(0, k - 1)
             cost, sol, its = _tabucol(G, k, sol, W, min(
-                itsperindv, it_limit - totalits), verbose)
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
         else:
-            for u in sol:
+            for u in G:
                 if sol[u] >= k:
                     sol[u] = -1
             cost, sol, its = _partialcol(G, k, sol, W, min(
-                itsperindv, it_limit - totalits), verbose)
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
         totalits += its
         if cost < bestcost:
-            bestcost, bestsol = cost, dict(sol)
-        if cost == 0 or totalits >= it_limit:
+            bestcost, bestsol = cost, list(sol)
+        if (cost == 0 or totalits >= it_limit or _timeup(deadline)
+                or _beaten(bestk, k)):
             return bestcost, bestsol, totalits
         pop.append(sol)
         popcost.append(cost)
     # At this point we have not found a zero-cost solution so we apply the main
     # part of the HEA, evolving the population of individual solutions
-    i = 1
+    if state is None or len(state["pop"]) < popsize:
+        i = 1
     while True:
+        save()
         # Choose two parents, make the offspring, and apply local search
         p1, p2 = random.sample(range(popsize), 2)
         if verbose > 0:
@@ -839,84 +1998,321 @@ def _HEA(G, k, c, W, it_limit, verbose, doTabuCol):
         off = GPX(pop[p1], pop[p2])
         if doTabuCol:
             cost, off, its = _tabucol(G, k, off, W, min(
-                itsperindv, it_limit - totalits), verbose)
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
         else:
             cost, off, its = _partialcol(G, k, off, W, min(
-                itsperindv, it_limit - totalits), verbose)
+                itsperindv, it_limit - totalits), verbose, deadline, bestk)
         totalits += its
         if cost < bestcost:
-            bestcost, bestsol = cost, dict(off)
-        if cost == 0 or totalits >= it_limit:
+            bestcost, bestsol = cost, list(off)
+        if (cost == 0 or totalits >= it_limit or _timeup(deadline)
+                or _beaten(bestk, k)):
             break
         # Replace the weaker of the parents with the new offspring solution
         weaker = p1
         if popcost[p2] > popcost[p1]:
             weaker = p2
         pop[weaker], popcost[weaker] = off, cost
+        if island is not None and i % interval == 0:
+            migrate()
         i += 1
     return bestcost, bestsol, totalits
 
 
+def _HEAisland(G, k, c, W, it_limit, doTabuCol, deadline, seed, island,
+               results):
+    # Runs the HEA on one island of _islandHEA in a worker process, and
+    # passes its result back through the results queue. If a solution using
+    # k colors is found, bestk is updated so that the other islands halt
+    random.seed(seed)
+    bestk, outbox = island[0], island[2]
+    cost, sol, its = _HEA(
+        G, k, c, W, it_limit, 0, doTabuCol, deadline, island
+    )
+    if cost == 0:
+        with bestk.get_lock():
+            bestk.value = min(bestk.value, k)
+    results.put((cost, sol, its))
+    # Individuals still waiting to migrate are not needed, so the process
+    # is allowed to exit without them being received
+    outbox.cancel_join_thread()
+
+
+def _islandHEA(G, k, c, W, it_limit, verbose, doTabuCol, deadline, islands,
+               interval=5):
+    # Island model version of the HEA. Each of the given number of islands
+    # evolves its own population in a worker process, starting from c, and
+    # the islands are arranged in a ring. Every interval offspring, each
+    # island sends a copy of its best individual to the next island, where
+    # it replaces the weakest individual if it is better. All islands halt
+    # once any of them finds a zero-cost solution. The best solution is
+    # returned, together with the largest number of iterations used by an
+    # island
+    bestk = multiprocessing.Value("i", k + 1)
+    results = multiprocessing.Queue()
+    ring = [multiprocessing.Queue() for i in range(islands)]
+    workers = [
+        multiprocessing.Process(
+            target=_HEAisland,
+            args=(G, k, list(c), W, it_limit, doTabuCol, deadline,
+                  random.getrandbits(32),
+                  (bestk, ring[i], ring[(i + 1) % islands], interval),
+                  results)
+        )
+        for i in range(islands)
+    ]
+    for p in workers:
+        p.start()
+    if verbose > 0:
+        print("    Running HEA on", islands, "islands using", k, "colors")
+    bestcost, bestsol, totalits, finished = float("inf"), list(c), 0, 0
+    while finished < islands:
+        try:
+            cost, sol, its = results.get(timeout=1)
+        except queue.Empty:
+            # Guard against workers that have terminated abnormally
+            if not any(p.is_alive() for p in workers):
+                break
+            continue
+        finished += 1
+        totalits = max(totalits, its)
+        if cost < bestcost:
+            bestcost, bestsol = cost, sol
+    for p in workers:
+        p.join()
+    return bestcost, bestsol, totalits
+
+
 def _removeColor(c, j, alg):
-    maxcol = max(c.values())
+    maxcol = max(c)
     # Uncolor nodes assigned to color j while maintaining use of colors
     # 0,1,...,maxcol-1
-    for v in c:
+    for v in range(len(c)):
         if c[v] == j:
             c[v] = -1
         elif c[v] == maxcol:
             c[v] = j
     # If tabucol is being used, assign uncolored nodes to random colors
     if alg in [2, 4]:
-        for v in c:
+        for v in range(len(c)):
             if c[v] == -1:
                 c[v] = random.randint(0, maxcol - 1)
 
 
-def _reducecolors(G, c, target, W, opt_alg, it_limit, verbose):
-    # Uses the specified optimization algorithm to try to reduce the number of
-    # colors in c to the target value. The observed proper solution with the
-    # fewest colors is returned (which may be using more colors than the
-    # target)
-    k = max(c.values()) + 1
-    if opt_alg == 1:
-        return _backtrackcol(G, target, verbose)
-    bestc, totalits = dict(c), 0
-    if verbose > 0:
-        print("Running local search algorithm:")
-        print("    Found solution with", k,
-              "colors. Total local search iterations = 0 /", it_limit)
-    while k > target and totalits < it_limit:
+def _localsearchworker(G, c, target, W, opt_alg, it_limit, deadline, seed,
+                       bestk, results):
+    # Runs one trajectory of TabuCol or PartialCol in a worker process of
+    # _parallellocalsearchcol. Each time the worker finds a proper solution
+    # using fewer colors than any other worker, bestk is updated and the
+    # solution is passed back through the results queue. The other workers
+    # then abandon this number of colors and continue from their current
+    # solutions using one fewer color. A final message without a solution
+    # gives the number of iterations used by the worker
+    random.seed(seed)
+    k, totalits = max(c) + 1, 0
+    while k > target and totalits < it_limit and not _timeup(deadline):
         k -= 1
         j = random.randint(0, k - 1)
         _removeColor(c, j, opt_alg)
+        if _beaten(bestk, k):
+            continue
+        if opt_alg == 2:
+            cost, c, its = _tabucol(
+                G, k, c, W, it_limit - totalits, 0, deadline, bestk)
+        else:
+            cost, c, its = _partialcol(
+                G, k, c, W, it_limit - totalits, 0, deadline, bestk)
+        totalits += its
+        if cost == 0:
+            with bestk.get_lock():
+                if bestk.value > k:
+                    bestk.value = k
+                    # A copy is sent, because the queue pickles it later
+                    results.put((list(c), totalits))
+    results.put((None, totalits))
+
+
+def _parallellocalsearchcol(G, c, target, W, opt_alg, it_limit, verbose,
+                            deadline, n_jobs):
+    # Version of _localsearchcol that runs n_jobs independent trajectories of
+    # TabuCol or PartialCol in worker processes, each with its own random
+    # seed and iteration limit. The number of colors is lowered as soon as
+    # any worker finds a proper solution. The observed proper solution with
+    # the fewest colors is returned, together with the largest number of
+    # iterations used by a worker
+    bestk = multiprocessing.Value("i", max(c) + 1)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=_localsearchworker,
+            args=(G, list(c), target, W, opt_alg, it_limit, deadline,
+                  random.getrandbits(32), bestk, results)
+        )
+        for i in range(n_jobs)
+    ]
+    for p in workers:
+        p.start()
+    bestc, totalits, finished = list(c), 0, 0
+    while finished < n_jobs:
+        try:
+            cH, its = results.get(timeout=1)
+        except queue.Empty:
+            # Guard against workers that have terminated abnormally
+            if not any(p.is_alive() for p in workers):
+                break
+            continue
+        if cH is None:
+            finished += 1
+            totalits = max(totalits, its)
+        elif max(cH) < max(bestc):
+            bestc = cH
+            if verbose > 0:
+                print("    Found solution with", max(cH) + 1,
+                      "colors. Local search iterations of worker =", its,
+                      "/", it_limit)
+    for p in workers:
+        p.join()
+    return bestc, totalits
+
+
+def _localsearchcol(G, c, target, W, opt_alg, it_limit, verbose,
+                    deadline=None, n_jobs=1, chk=None):
+    # Uses the specified local search algorithm to try to reduce the number of
+    # colors in c to the target value. The observed proper solution with the
+    # fewest colors is returned, together with the number of iterations used.
+    # If n_jobs > 1, TabuCol and PartialCol are run in parallel processes,
+    # and the HEA is run using this many islands. If chk is a _Checkpoint,
+    # the search is checkpointed (n_jobs must then be 1)
+    if n_jobs > 1 and opt_alg in [2, 3]:
+        # Starting processes is costly, so do not if there is nothing to do
+        if max(c) + 1 <= target or it_limit <= 0 or _timeup(deadline):
+            return list(c), 0
+        return _parallellocalsearchcol(
+            G, c, target, W, opt_alg, it_limit, verbose, deadline, n_jobs
+        )
+    state = None
+    if chk is not None:
+        # Calls completed before a resumed search was saved return at once
+        chk.calls += 1
+        if chk.calls <= len(chk.done):
+            return chk.done[chk.calls - 1]
+        chk.push()
+        state = chk.restore()
+    k = max(c) + 1
+    bestc, totalits = list(c), 0
+    while state is not None or (
+        k > target and totalits < it_limit and not _timeup(deadline)
+    ):
+        if state is None:
+            k -= 1
+            j = random.randint(0, k - 1)
+            _removeColor(c, j, opt_alg)
+        else:
+            k, c, bestc, totalits = state["k"], state["c"], state["bestc"], \
+                state["totalits"]
+            state = None
+        if chk is not None:
+            chk.update({"k": k, "c": list(c), "bestc": bestc,
+                        "totalits": totalits})
+            chk.push()
         if opt_alg == 2:
             cost, c, its = _tabucol(
-                G, k, c, W, it_limit - totalits, verbose - 1)
+                G, k, c, W, it_limit - totalits, verbose - 1, deadline,
+                None, chk)
         elif opt_alg == 3:
             cost, c, its = _partialcol(
-                G, k, c, W, it_limit - totalits, verbose - 1)
+                G, k, c, W, it_limit - totalits, verbose - 1, deadline,
+                None, chk)
+        elif n_jobs > 1:
+            cost, c, its = _islandHEA(
+                G, k, c, W, it_limit - totalits, verbose - 1, opt_alg == 4,
+                deadline, n_jobs)
         elif opt_alg == 4:
             cost, c, its = _HEA(
-                G, k, c, W, it_limit - totalits, verbose - 1, True)
+                G, k, c, W, it_limit - totalits, verbose - 1, True,
+                deadline, None, chk)
         else:
             cost, c, its = _HEA(
-                G, k, c, W, it_limit - totalits, verbose - 1, False)
+                G, k, c, W, it_limit - totalits, verbose - 1, False,
+                deadline, None, chk)
+        if chk is not None:
+            chk.pop()
         totalits += its
         if cost == 0:
-            bestc = dict(c)
+            bestc = list(c)
             if verbose > 0:
                 print("    Found solution with", k,
                       "colors. Total local search iterations =", totalits,
                       "/", it_limit)
+    if chk is not None:
+        chk.pop()
+        chk.done.append((bestc, totalits))
+    return bestc, totalits
+
+
+def _reducecolors(G, c, target, W, opt_alg, it_limit, verbose,
+                  deadline=None, n_jobs=1, chk=None):
+    # Uses the specified optimization algorithm to try to reduce the number of
+    # colors in c to the target value. The observed proper solution with the
+    # fewest colors is returned (which may be using more colors than the
+    # target), together with the number of local search iterations used.
+    # Nodes outside of the target-core of G are removed and colored
+    # afterwards. If G is disconnected, each component is considered
+    # separately, with the iteration limit shared between them, unless the
+    # local search is run in parallel processes (n_jobs > 1), in which case G
+    # is considered as a whole so that the processes are only started once.
+    # The search also halts if the deadline passes. n_jobs gives the number
+    # of worker processes used by the local search algorithms, and chk is an
+    # optional _Checkpoint used to save and resume their searches
+    if opt_alg == 1:
+        return _backtrackcol(G, target, verbose, deadline, c), 0
+    totalits = 0
+    P = _peel(G, target)
+    if P:
+        def solvecore(H, V, target):
+            nonlocal totalits
+            cH, totalits = _reducecolors(
+                H, _restrictcoloring(c, V), target,
+                _getSubgraphWeights(W, G, V, opt_alg in [2, 4]), opt_alg,
+                it_limit, verbose, deadline, n_jobs, chk
+            )
+            return cH
+
+        return _solvecore(G, P, target, solvecore), totalits
     if verbose > 0:
-        if totalits >= it_limit:
+        print("Running local search algorithm:")
+        print("    Found solution with", max(c) + 1,
+              "colors. Total local search iterations = 0 /", it_limit)
+
+    def solve(H, V, target):
+        nonlocal totalits
+        cH, its = _localsearchcol(
+            H, _restrictcoloring(c, V), target,
+            _getSubgraphWeights(W, G, V, opt_alg in [2, 4]), opt_alg,
+            it_limit - totalits, verbose, deadline, n_jobs, chk
+        )
+        totalits += its
+        return cH
+
+    comps = G.components()
+    if len(comps) > 1 and n_jobs == 1:
+        c = _solvecomponents(G, comps, target, solve)
+    else:
+        c, totalits = _localsearchcol(
+            G, c, target, W, opt_alg, it_limit, verbose, deadline, n_jobs,
+            chk
+        )
+    if verbose > 0:
+        if max(c) + 1 > target and _timeup(deadline):
+            print("Ending local search at iteration", totalits,
+                  "- time limit has been reached.")
+        elif totalits >= it_limit:
             print("Ending local search. Iteration limit of",
                   it_limit, "has been reached.")
         else:
             print("Ending local search at iteration", totalits,
                   "- optimal solution achieved.")
-    return bestc
+    return c, totalits
 
 
 def s_chain(G, c, v, L):
@@ -1165,7 +2561,8 @@ def kempe_chain(G, c, v, i, j):
     return s_chain(G, c, v, (i, j))
 
 
-def max_independent_set(G, weight=None, it_limit=0, verbose=0):
+def max_independent_set(G, weight=None, it_limit=0, verbose=0,
+                        time_limit=None, mis_alg=1):
     r"""Attempt to identify the largest independent set of nodes in a graph.
 
     Here, nodes can also be allocated weights if desired.
@@ -1177,10 +2574,12 @@ def max_independent_set(G, weight=None, it_limit=0, verbose=0):
     the subset of mutually nonadjacent nodes whose weight-total is maximized.
 
     The problem of determining a maximum(-weighted) independent set of nodes
-    is NP-hard. Consequently, this method makes use of a polynomial-time
-    heuristic based on local search. It will always return an independent
-    set but offers no guarantees as to whether this is an optimal solution.
-    The algorithm halts once the iteration limit has been reached.
+    is NP-hard. Consequently, this method first applies exact reduction rules
+    that shrink the graph, and then uses a polynomial-time heuristic based on
+    local search on the remainder. It will always return an independent set
+    but, unless the reduction rules solve the whole graph, offers no
+    guarantees as to whether this is an optimal solution. The algorithm halts
+    once the iteration limit (or time limit) has been reached.
 
     Note that the similar problem of determining the maximum(-weighted)
     independent set of edges is equivalent to finding a maximum(-weighted)
@@ -1198,14 +2597,32 @@ def max_independent_set(G, weight=None, it_limit=0, verbose=0):
         weights must be positive.
 
     it_limit : int, optional (default=0)
-        Number of iterations of the local search procedure. Each iteration has
-        a complexity $O(m + n)$, where $n$ is the number of nodes and $m$ is
-        the number of edges.
+        Number of iterations of the local search procedure. With
+        ``mis_alg=1``, each iteration has a complexity $O(m + n)$, where $n$
+        is the number of nodes and $m$ is the number of edges in the graph
+        that remains after applying the reduction rules. With ``mis_alg=2``,
+        iterations are usually much cheaper (see below).
 
     verbose : int, optional (default=0)
         If set to a positive value, information is output during the
         optimization process. In this output, the cost refers to the number
-        of nodes not in the independent set.
+        (or weight) of the remaining nodes not in the independent set.
+
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    mis_alg : int, optional (default=1)
+        An integer specifying the local search method that is used. It must
+        be one of the following
+
+        * ``1`` : The PartialCol algorithm for node $k$-coloring, using $k=1$.
+        * ``2`` : An iterated local search algorithm designed specifically for
+          this problem.
+
+        Further details are given in the notes section below.
 
     Returns
     -------
@@ -1245,6 +2662,10 @@ def max_independent_set(G, weight=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``mis_alg`` is not among the supported options.
+
         If a node with a non-positive weight is specified.
 
     KeyError
@@ -1252,14 +2673,62 @@ def max_independent_set(G, weight=None, it_limit=0, verbose=0):
 
     Notes
     -----
-    This method uses the PartialCol algorithm for node $k$-coloring using
-    $k=1$. The set of nodes assigned to this color corresponds to the
+    This method first applies the following reduction rules, each of which
+    removes nodes from the graph without changing the weight of a maximum
+    independent set [3]_. Here, $N(v)$ is the set of neighbors of node $v$,
+    $N[v] = N(v) \cup \{v\}$, and $w(v)$ is the weight of $v$.
+
+    * Neighborhood rule: If $w(v)$ is at least the total weight of $N(v)$,
+      then $v$ is put into the independent set and $N[v]$ is removed. This
+      includes all nodes of degree zero and, in the unweighted case, all nodes
+      of degree one.
+    * Pendant rule: If $v$ has one neighbor $u$ with $w(u) > w(v)$, then $v$ is
+      removed and $w(u)$ is reduced by $w(v)$. If $u$ is not in the final
+      independent set, $v$ is added to it.
+    * Domination rule: If $u$ and $v$ are adjacent, $N[u] \subseteq N[v]$, and
+      $w(u) \geq w(v)$, then $v$ is removed.
+    * Fold rule: If $v$ has exactly two neighbors $a$ and $b$, these are not
+      adjacent, and $w(v) \geq \max(w(a), w(b))$, then $v$, $a$ and $b$ are
+      replaced by a single node of weight $w(a) + w(b) - w(v)$ that is
+      adjacent to $N(a) \cup N(b) \setminus \{v\}$. If this node is in the
+      final independent set, it is replaced by $a$ and $b$; otherwise, $v$ is
+      added.
+    * Twin rule: If two nonadjacent nodes $u$ and $v$ have $N(u) = N(v)$, then
+      $v$ is merged into $u$, adding its weight to $w(u)$.
+
+    The rules are applied repeatedly until none remain applicable. The
+    resultant graph is known as the kernel. In practice, these reductions are
+    very effective for sparse graphs, often removing all nodes, in which case
+    the returned independent set is optimal.
+
+    A local search algorithm is then applied to the kernel, starting from the
+    first color class of a DSatur coloring. An independent set of $G$ is then
+    recovered by undoing the reductions in reverse order.
+
+    If ``mis_alg=1``, the PartialCol algorithm for node $k$-coloring is used
+    with $k=1$. The set of nodes assigned to this color corresponds to the
     independent set. PartialCol is based on tabu search. Here, each iteration
     of PartialCol has complexity $O(n + m)$. It also occupies $O(n + m)$ of
-    memory space.
+    memory space. In practice, iterations are much cheaper than this, because
+    the possible moves are held in buckets according to their costs, and only
+    the moves of nodes adjacent to those that change color are updated in
+    each iteration. PartialCol is described in detail in [1]_. The c++ code
+    used in [1]_ and [2]_ forms the basis of this library's Python
+    implementations.
 
-    The above algorithm is described in detail in [1]_. The c++ code used in
-    [1]_ and [2]_ forms the basis of this library's Python implementations.
+    If ``mis_alg=2``, the iterated local search of Andrade et al. [4]_ is used,
+    extended to node weights. For each node outside the independent set, this
+    keeps track of the number and total weight of its neighbors in the set.
+    Its local search then applies two types of move until neither improves
+    the solution: a node is added to the set, and its neighbors are removed,
+    if it is heavier than these neighbors; and a node is removed from the set
+    and replaced by two nonadjacent neighbors that have no other neighbors in
+    the set, if these are heavier. Only nodes whose neighbors have changed
+    are reexamined, so the cost of a move depends only on the degrees of the
+    nodes involved. Each iteration forces a random node into the set and
+    then applies the local search. Worse solutions are sometimes accepted,
+    with a probability that decreases with their distance from the current
+    and best solutions; otherwise, the changes are undone.
 
     See Also
     --------
@@ -1273,26 +2742,60 @@ def max_independent_set(G, weight=None, it_limit=0, verbose=0):
       <https://link.springer.com/book/10.1007/978-3-030-81054-2>.
     .. [2] Lewis, R: Graph Colouring Algorithm User Guide
       <https://rhydlewis.eu/gcol/>
+    .. [3] Lamm, S., C. Schulz, D. Strash, R. Williger and H. Zhang (2019)
+      'Exactly Solving the Maximum Weight Independent Set Problem on Large
+      Real-World Graphs'. Proceedings of the Twenty-First Workshop on
+      Algorithm Engineering and Experiments (ALENEX), pp. 144-158.
+    .. [4] Andrade, D., M. Resende and R. Werneck (2012) 'Fast Local Search
+      for the Maximum Independent Set Problem'. Journal of Heuristics, vol.
+      18(4), pp. 525-547.
 
     """
-    _check_params(G, "dsatur", 3, it_limit, verbose)
+    _check_params(G, "dsatur", 3, it_limit, verbose, time_limit)
+    if mis_alg not in {1, 2}:
+        raise ValueError(
+            "Error, chosen local search method must be one of", {1, 2}
+        )
+    deadline = _getdeadline(time_limit)
     if len(G) == 0:
         return {}
     elif G.number_of_edges() == 0:
         return list(G)
     W = _getNodeWeights(G, weight)
-    # Make an initial coloring via dsatur and uncolor all but the first color
-    # class
-    c = _dsatur(G)
-    for v in c:
-        if c[v] > 0:
-            c[v] = -1
-    cost, c, its = _partialcol(G, 1, c, W, it_limit, verbose)
-    return [v for v in c if c[v] == 0]
+    # Shrink the graph using reduction rules, giving the kernel K. Make an
+    # initial coloring of K via dsatur, and optimize its first color class
+    # using the chosen local search method. The solution is then lifted back
+    # to G
+    A = _CSRGraph(G)
+    adj, w, log = _reduceMIS(A, W)
+    if verbose > 0:
+        print("Reduction rules have reduced the graph from", len(A), "to",
+              len(adj), "nodes")
+    S = []
+    if adj:
+        K = _CSRGraph(adj)
+        WK = [w[u] for u in K.nodes]
+        c = _dsatur(K)
+        if mis_alg == 2:
+            cost, S, its = _ilsMIS(
+                K, [v for v in K if c[v] == 0], WK, it_limit, verbose,
+                deadline
+            )
+        else:
+            for v in K:
+                if c[v] > 0:
+                    c[v] = -1
+            cost, c, its = _partialcol(
+                K, 1, c, WK, it_limit, verbose, deadline
+            )
+            S = [v for v in K if c[v] == 0]
+        S = [K.nodes[v] for v in S]
+    S = _liftMIS(S, log)
+    return [A.nodes[v] for v in A if v in S]
 
 
 def min_cost_k_coloring(G, k, weight=None, weights_at="nodes", it_limit=0,
-                        HEA=False, verbose=0):
+                        HEA=False, verbose=0, time_limit=None):
     r"""Color the nodes of the graph using ``k`` colors.
 
     This is done so that a cost function is minimized. Equivalently, this
@@ -1329,16 +2832,16 @@ def min_cost_k_coloring(G, k, weight=None, weights_at="nodes", it_limit=0,
           $k$-coloring that minimizes the sum of the weights of the uncolored
           nodes. Clashes are not permitted in a solution. The algorithm halts
           when a zero-cost solution has been determined (this corresponds to a
-          full, proper node $k$-coloring), or when the iteration limit is
-          reached.
+          full, proper node $k$-coloring), or when the iteration limit (or
+          time limit) is reached.
         * ``'edges'`` : Here, clashes are permitted in a solution. If
           ``weight=None``, the method seeks a $k$-coloring in which the number
           of clashes is minimized; otherwise, the method seeks a coloring that
           minimizes the sum of the weights of edges involved in a clash.
           Uncolored nodes are not permitted in a solution. The algorithm halts
           when a zero-cost solution has been determined (this corresponds to a
-          full, proper node $k$-coloring), or when the iteration limit is
-          reached.
+          full, proper node $k$-coloring), or when the iteration limit (or
+          time limit) is reached.
 
     it_limit : int, optional (default=0)
         Number of iterations of the local search procedure. Each iteration has
@@ -1353,6 +2856,12 @@ def min_cost_k_coloring(G, k, weight=None, weights_at="nodes", it_limit=0,
         If set to a positive value, information is output during the
         optimization process.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
     Returns
     -------
     dict
@@ -1412,6 +2921,8 @@ def min_cost_k_coloring(G, k, weight=None, weights_at="nodes", it_limit=0,
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
         If ``k`` is not a nonnegative integer.
 
         If a node/edge with a non-positive weight is specified.
@@ -1466,33 +2977,44 @@ def min_cost_k_coloring(G, k, weight=None, weights_at="nodes", it_limit=0,
         raise ValueError(
             "Error, weights_at should be either 'nodes' or 'edges'"
         )
-    _check_params(G, "dsatur", 3, it_limit, verbose)
+    _check_params(G, "dsatur", 3, it_limit, verbose, time_limit)
+    deadline = _getdeadline(time_limit)
     if len(G) == 0:
         return {}
-    c = _dsatur(G)
+    A = _CSRGraph(G)
+    c = _dsatur(A)
     if weights_at == "nodes":
         W = _getNodeWeights(G, weight)
-        for v in c:
+        for v in A:
             if c[v] >= k:
                 c[v] = -1
         if HEA is True:
-            cost, c, its = _HEA(G, k, c, W, it_limit, verbose, False)
+            cost, c, its = _HEA(
+                A, k, c, W, it_limit, verbose, False, deadline
+            )
         else:
-            cost, c, its = _partialcol(G, k, c, W, it_limit, verbose)
+            cost, c, its = _partialcol(
+                A, k, c, W, it_limit, verbose, deadline
+            )
     else:
         W = _getEdgeWeights(G, weight)
-        for v in c:
+        for v in A:
             if c[v] >= k:
                 c[v] = random.randint(0, k - 1)
         if HEA is True:
-            cost, c, its = _HEA(G, k, c, W, it_limit, verbose, True)
+            cost, c, its = _HEA(
+                A, k, c, W, it_limit, verbose, True, deadline
+            )
         else:
-            cost, c, its = _tabucol(G, k, c, W, it_limit, verbose)
-    return c
+            cost, c, its = _tabucol(
+                A, k, c, W, it_limit, verbose, deadline
+            )
+    return A.to_labels(c)
 
 
 def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
-                              verbose=0):
+                              verbose=0, time_limit=None, n_jobs=1,
+                              eq_alg=1):
     r"""Attempt to color the nodes of a graph using ``k`` colors.
 
     This is done so that (a) all adjacent nodes have different colors, and (b)
@@ -1537,7 +3059,9 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
           The algorithm halts only when the existence of a node $k$-coloring
-          has been proved or disproved.
+          has been proved or disproved, or when ``time_limit`` expires
+          (in which case a ``ValueError`` is raised if no $k$-coloring
+          has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes to have the same color.
           Each iteration has a complexity $O(m + kn)$, where $n$ is the number
@@ -1560,12 +3084,44 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
     it_limit : int, optional (default=0)
         Number of iterations of the local search procedure. Not applicable
-        when using ``opt_alg=1``.
+        when using ``opt_alg=1``. If ``eq_alg=2``, this is also the number of
+        iterations of the tabu search used to balance the color classes.
 
     verbose : int, optional (default=0)
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
+    eq_alg : int, optional (default=1)
+        An integer specifying the method used to reduce the standard deviation
+        in weights across the $k$ color classes, once a $k$-coloring has been
+        found. It must be one of the following
+
+        * ``1`` : A steepest descent algorithm that halts at the first local
+          optimum.
+        * ``2`` : A tabu search algorithm that also performs moves that worsen
+          the balance, allowing it to escape from local optima. It halts after
+          ``it_limit`` iterations. Each iteration has a complexity
+          $O(n + m + k^2)$, where $n$ and $m$ are the number of nodes and
+          edges in the graph.
+
+        Both algorithms also halt when ``time_limit`` is reached, or when no
+        further improvement in the balance is possible. Further details are
+        given in the notes section of the
+        :meth:`equitable_node_k_coloring` method.
+
     Returns
     -------
     dict
@@ -1625,6 +3181,12 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
+        If ``eq_alg`` is not among the supported options.
+
         If ``k`` is not a nonnegative integer.
 
         If a clique larger than ``k`` is observed in the graph.
@@ -1646,9 +3208,24 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
     classes. This process involves evaluating each Kempe-chain interchange in
     the current solution [1]_ and performing the interchange that results in
     the largest reduction in standard deviation. This process repeats until
-    there are no interchanges that reduce the standard deviation. Each
-    iteration of this local search process takes $O(n^2)$ time. Further details
-    on this optimization method can be found in Chapter 7 of [2], or in [3]_.
+    there are no interchanges that reduce the standard deviation. Swaps of
+    pairs of nodes that have no neighbors in each other's color class are also
+    considered. An interchange between colors $i$ and $j$ only alters the
+    changes in cost offered by moves involving $i$ or $j$, so the best move for
+    each pair of colors is stored and only $O(k)$ pairs are reevaluated after
+    each interchange. Each iteration of this local search process therefore
+    takes $O(n + m + k^2)$ time. Further details on this optimization method
+    can be found in Chapter 7 of [2], or in [3]_.
+
+    If ``eq_alg=2``, steepest descent is replaced by tabu search. At each
+    iteration, this performs the best available interchange or swap, even if
+    it increases the standard deviation. To prevent cycling, nodes that are
+    moved out of a color class are then barred from returning to it for a
+    short random number of iterations (unless this would give a new best
+    solution). The best solution observed in ``it_limit`` iterations is
+    returned. Both methods halt early if the color class weights are as equal
+    as possible (for integer weights, this is when they all differ by at most
+    one).
 
     All the above algorithms are described in detail in [2]_. The c++ code used
     in [2]_ and [4]_ forms the basis of this library's Python implementations.
@@ -1674,7 +3251,9 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
     """
     if k < 0:
         raise ValueError("Error, nonnegative integer needed for k")
-    _check_params(G, "dsatur", opt_alg, it_limit, verbose)
+    _check_params(G, "dsatur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs, eq_alg)
+    deadline = _getdeadline(time_limit)
     if len(G) == 0:
         return {}
     cliqueNum = nx.approximation.large_clique_size(G)
@@ -1684,30 +3263,36 @@ def equitable_node_k_coloring(G, k, weight=None, opt_alg=None, it_limit=0,
             "a k-coloring is not possible. Try increasing k"
         )
     W = _getNodeWeights(G, weight)
-    c = _dsatur_equitable(G, k, W)
+    A = _CSRGraph(G)
+    c = _dsatur_equitable(A, k, W)
     if c is None:
         if opt_alg is None:
             raise ValueError(
                 "Error, a k-coloring could not be found. Try changing the "
                 "optimisation options or increasing k"
             )
-        c = _dsatur(G)
+        c = _dsatur(A)
         if opt_alg in [2, 4]:
             WPrime = _getEdgeWeights(G, None)
         else:
             WPrime = _getNodeWeights(G, None)
-        c = _reducecolors(G, c, k, WPrime, opt_alg, it_limit, verbose)
-        if max(c.values()) + 1 > k:
+        c, its = _reducecolors(
+            A, c, k, WPrime, opt_alg, it_limit, verbose, deadline, n_jobs
+        )
+        if max(c) + 1 > k:
             raise ValueError(
                 "Error, could not construct a k-coloring of this graph. Try "
                 "increasing k or using more optimisation"
             )
     # If we are here we have a k-coloring. Attempt to decrease the SD
-    # across the color classes using a steepest descent heuristic
-    return _LS_equitable(G, c, k, W, verbose)
+    # across the color classes using the chosen heuristic
+    return A.to_labels(
+        _LS_equitable(A, c, k, W, eq_alg, it_limit, verbose, deadline)
+    )
 
 
-def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
+def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0,
+                    time_limit=None, n_jobs=1):
     r"""Attempt to color the nodes of a graph using ``k`` colors.
 
     This is done so that adjacent nodes have different colors. A set of nodes
@@ -1742,7 +3327,9 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
           The algorithm halts only when the existence of a node $k$-coloring
-          has been proved or disproved.
+          has been proved or disproved, or when ``time_limit`` expires
+          (in which case a ``ValueError`` is raised if no $k$-coloring
+          has been found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes to have the same color.
           Each iteration has a complexity $O(m + kn)$, where $n$ is the number
@@ -1771,6 +3358,19 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -1785,11 +3385,11 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
     >>> G = nx.dodecahedral_graph()
     >>> c = gcol.node_k_coloring(G, 4)
     >>> print(c)
-    {0: 0, 1: 1, 19: 2, 10: 3, 2: 0, ..., 15: 3}
+    {0: 0, 1: 1, 2: 0, 3: 1, 4: 3, ..., 19: 2}
     >>>
     >>> c = gcol.node_k_coloring(G, 3)
     >>> print(c)
-    {0: 0, 1: 1, 19: 2, 10: 1, 2: 0, ..., 12: 1}
+    {0: 0, 1: 1, 2: 0, 3: 1, 4: 2, ..., 19: 2}
 
     Raises
     ------
@@ -1805,6 +3405,10 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``k`` is not a nonnegative integer.
 
         If a clique larger than ``k`` is observed in the graph.
@@ -1817,7 +3421,7 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
     DSatur algorithm [1]_. During this process, each node is assigned to the
     feasible color class $j$ (where $0 \leq j \leq k$) with the fewest nodes.
     This encourages an equitable spread of nodes across the $k$ colors. This
-    process has a complexity of $O((n \lg n) + (nk) + (m \lg m)$. If a node
+    process has a complexity of $O(n\Delta(G) + nk + m)$. If a node
     $k$-coloring cannot be achieved in this way, further optimization is
     carried out, if desired. These optimization routines are the same as those
     used by the :meth:`node_coloring` method. They also halt immediately once
@@ -1844,7 +3448,9 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
     """
     if k < 0:
         raise ValueError("Error, nonnegative integer needed for k")
-    _check_params(G, "dsatur", opt_alg, it_limit, verbose)
+    _check_params(G, "dsatur", opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
+    deadline = _getdeadline(time_limit)
     if len(G) == 0:
         return {}
     cliqueNum = nx.approximation.large_clique_size(G)
@@ -1854,27 +3460,32 @@ def node_k_coloring(G, k, opt_alg=None, it_limit=0, verbose=0):
             "a k-coloring is not possible. Try increasing k"
         )
     W = _getNodeWeights(G, None)
-    c = _dsatur_equitable(G, k, W)
+    A = _CSRGraph(G)
+    c = _dsatur_equitable(A, k, W)
     if c is None:
         if opt_alg is None:
             raise ValueError(
                 "Error, a k-coloring could not be found. Try changing the "
                 "optimisation options or increasing k"
             )
-        c = _dsatur(G)
+        c = _dsatur(A)
         if opt_alg in [2, 4]:
             W = _getEdgeWeights(G, None)
-        c = _reducecolors(G, c, k, W, opt_alg, it_limit, verbose)
-        if max(c.values()) + 1 > k:
+        c, its = _reducecolors(
+            A, c, k, W, opt_alg, it_limit, verbose, deadline, n_jobs
+        )
+        if max(c) + 1 > k:
             raise ValueError(
                 "Error, could not construct a k-coloring of this graph. Try "
                 "increasing k or using more optimisation"
             )
     # If we are here we have a k-coloring
-    return c
+    return A.to_labels(c)
 
 
-def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
+def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0,
+                  time_limit=None, n_jobs=1, checkpoint=None,
+                  checkpoint_interval=60, resume_from=None):
     r"""Return a coloring of a graph's nodes.
 
     A node coloring of a graph is an assignment of colors to nodes so that
@@ -1909,17 +3520,30 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
           greedy algorithm for graph node coloring [1]_.
         * ``'welsh-powell'`` : Orders the graph's nodes by decreasing degree,
           then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the graph to form a smallest-last ordering, then applies the
+          greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          graph, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring
           [2]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring [3]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies, running these concurrently
+          for larger graphs. The solution using the fewest colors is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to try
         to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes to have the same color.
           Each iteration has a complexity $O(m + kn)$, where $n$ is the number
@@ -1947,6 +3571,38 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        ``'portfolio'`` strategy and the subsequent optimization process.
+        When this limit is reached, the best solution found so far is used,
+        even if ``it_limit`` has not been reached. If ``None``, no limit is
+        applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
+    checkpoint : None or str, optional (default=None)
+        The name of a file to which the state of the local search algorithm
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``) is periodically
+        saved. If ``None``, no checkpoints are made. Checkpointing cannot be
+        used with ``n_jobs`` greater than one.
+
+    checkpoint_interval : float, optional (default=60)
+        The number of seconds between checkpoints.
+
+    resume_from : None or str, optional (default=None)
+        The name of a file written using ``checkpoint``. If given, the search
+        saved in this file is continued, rather than starting a new one. The
+        same graph and ``opt_alg`` must be used. Because the state of the
+        random number generator is saved, the resumed search makes the same
+        choices as the original would have. Iterations performed before the
+        checkpoint count towards ``it_limit``, but ``time_limit`` applies
+        afresh.
+
     Returns
     -------
     dict
@@ -1995,6 +3651,17 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
+        If ``checkpoint_interval`` is not a positive number.
+
+        If ``checkpoint`` or ``resume_from`` is used with ``n_jobs`` greater
+        than one.
+
+        If ``resume_from`` was made using a different graph or ``opt_alg``.
+
     Notes
     -----
     Given a graph $G=(V,E)$ with $n$ nodes and $m$ edges, the greedy algorithm
@@ -2013,27 +3680,94 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
     produce a solution with $k \leq\max_{i=1,\ldots,n} \min(\deg(v_i)+1,
     i)$ colors. This bound is an improvement on $\Delta(G) + 1$.
 
+    The ``smallest_last`` strategy forms its ordering by repeatedly removing
+    a node of minimum degree from the graph, with the nodes held in buckets
+    according to their current degrees. The greedy algorithm is then applied
+    to the nodes in the reverse of the order in which they were removed. The
+    overall complexity is $O(n + m)$, making this strategy suitable for very
+    large sparse graphs. It is guaranteed to produce a solution with $k \leq
+    \delta^*(G) + 1$ colors, where $\delta^*(G)$ is the degeneracy of $G$
+    (the largest minimum degree among all of $G$'s subgraphs). This bound is
+    never worse than the bound given for ``welsh-powell``, and it is often
+    considerably lower for sparse graphs, such as planar graphs, where
+    $\delta^*(G) \leq 5$.
+
+    The ``jones_plassmann`` strategy assigns a random priority to each node
+    and then colors the graph in a series of rounds. In each round, all
+    uncolored nodes whose priorities exceed those of their uncolored neighbors
+    are assigned the lowest color label not used by their neighbors. Because
+    these nodes form an independent set, each round is carried out using
+    vectorized NumPy operations on the graph's edges, with each edge being
+    considered a constant number of times overall. The result is the same as
+    applying the greedy algorithm to the nodes in decreasing order of
+    priority, so the solutions are of a similar quality to the ``random``
+    strategy. However, it is usually much faster for very large sparse
+    graphs.
+
+    The ``portfolio`` strategy applies several of the above strategies and
+    returns the solution using the fewest colors. No single strategy is best
+    for all graphs, so this gives the best of these strategies without having
+    to choose one in advance. For larger graphs, the strategies are run
+    concurrently in separate processes, meaning that the run time is close to
+    that of the slowest strategy (usually ``rlf``). If ``time_limit`` is
+    specified, the best solution produced within this limit is used, and any
+    unfinished strategies are abandoned. A solution from the linear-time
+    ``smallest_last`` strategy is always available.
+
     The ``dsatur`` and ``rlf`` strategies are exact for bipartite, cycle, and
     wheel graphs (that is, solutions with the minimum number of colors are
-    guaranteed). The implementation of ``dsatur`` uses a priority queue and has
-    a complexity of $O(n \lg n + m \lg m)$. The ``rlf`` implementation has a
-    complexity of $O(nm)$. In general, the ``rlf`` strategy yields the best
-    solutions of the four strategies, though it is computationally more
-    expensive. If expense is an issue, then ``dsatur`` is a cheaper alternative
-    that also offers high-quality solutions in most cases. See [2]_, [3]_, and
-    [4]_ for further information.
+    guaranteed). The implementation of ``dsatur`` holds the uncolored nodes in
+    buckets according to their saturation degrees and degrees, allowing each
+    node to be repositioned in constant time. It has a complexity of
+    $O(n\Delta(G) + m)$, where $\Delta(G)$ is the maximum degree in $G$. The
+    ``rlf`` implementation adjusts the neighbor counts of nodes incrementally
+    and selects nodes using the same bucket structure. It has a complexity of
+    $O(n\Delta(G) + km)$, where $k$ is the number of colors used. In general,
+    the ``rlf`` strategy yields the best solutions of the five strategies,
+    though it is computationally more expensive. If expense is an issue, then
+    ``dsatur`` is a cheaper alternative that also offers high-quality solutions
+    in most cases. See [2]_, [3]_, and [4]_ for further information.
+
+    For dense graphs (those with a density of at least $0.1$ and up to 10,000
+    nodes), the above strategies are carried out using the rows of the
+    graph's adjacency matrix as bitsets. Operations such as identifying the
+    colors adjacent to a node or updating the neighbor counts of the ``rlf``
+    strategy are then vectorized, which is considerably faster in these cases.
+    This uses $O(n^2)$ memory.
 
     If an optimization algorithm is used, further efforts are made to reduce
     the number of colors. The backtracking approach (``opt_alg=1``) is an
     implementation of the exact algorithm described in [4]_. It has exponential
-    runtime and halts only when an optimum solution has been found. At the
-    start of execution, a large clique $C\subseteq V$ is identified using the
-    NetworkX function ``max_clique(G)`` and the nodes of $C$ are each assigned
-    to a different color. The main backtracking algorithm is then executed and
-    only halts only when a solution using $|C|$ colors has been identified, or
-    when the algorithm has backtracked to the root of the search tree. In both
-    cases the returned solution will be optimal (that is, will be using
-    $\chi(G)$ colors).
+    runtime and halts only when an optimum solution has been found, or when
+    ``time_limit`` expires (returning the best solution found). At the
+    start of execution, a large clique $C\subseteq V$ is identified by
+    greedily growing a clique from each node, and the nodes of $C$ are each
+    assigned to a different color. An incumbent solution is also taken from
+    the better of the initial solution and a DSatur solution, and this is
+    improved by a short run of the local search algorithm used with
+    ``opt_alg=2``. The search tree therefore only contains solutions using
+    fewer colors than the incumbent, and the search can be stopped at any
+    time using ``time_limit``. The main backtracking algorithm is then
+    executed and halts only when a solution using $|C|$ colors has been
+    identified, or when the algorithm has backtracked to the root of the
+    search tree. In both cases the returned solution will be optimal (that
+    is, will be using $\chi(G)$ colors). The search is iterative, keeping its
+    own stack and a trail of the changes made to the saturation degrees so
+    that these can be undone when backtracking. It is therefore not
+    restricted by Python's recursion limit. Also, a node is only assigned to
+    a previously unused color if this is the lowest such color, which avoids
+    exploring solutions that differ only in their color labels. The sets of
+    uncolored nodes at each saturation degree, and the sets of colors
+    adjacent to each node, are held as bitsets, so the next node is chosen
+    using a few bitwise operations. A lower bound is also computed at each
+    node of the search tree: a clique $K$ of uncolored nodes is grown
+    greedily from the chosen node, and the branch is pruned if the nodes of
+    $K$ cannot each be given a different color that is not adjacent to them.
+    (To limit memory use, this bound is not used for graphs with more than
+    8192 nodes unless they are dense.) The bound reduces the size of the
+    search tree, but the run time still grows exponentially: random graphs
+    with 70 nodes and an edge density of 0.5, for example, can take several
+    minutes.
 
     If local search is used (``opt_alg`` is set to ``2``, ``3``, ``4``, or
     ``5``), the algorithm removes a color class and uses the chosen local
@@ -2043,20 +3777,64 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
     reached. Fewer colors (but longer run times) occur with larger iteration
     limits.
 
+    If ``time_limit`` is set, the optimization process also halts once this
+    many seconds have elapsed, and the best solution observed so far is
+    returned. The clock is only consulted every few iterations, so the limit
+    may be overrun slightly. When ``opt_alg=1``, a complete solution is
+    always available from the start: the DSatur solution (or the initial
+    solution, if this uses fewer colors) is used as the incumbent. Before
+    backtracking begins, this incumbent is improved by TabuCol, which runs
+    for at most 10,000 iterations and one second (and less if ``time_limit``
+    is smaller). The cost of this warm start is therefore bounded, whatever
+    the size of the graph.
+
+    Before optimization, nodes with fewer than $t$ neighbors are repeatedly
+    removed from the graph, where $t$ is the target number of colors. The
+    optimization algorithms are then only applied to the remaining nodes,
+    which form the $t$-core of the graph. The removed nodes are colored
+    afterwards, in the reverse order of their removal, by assigning each to
+    the lowest color label not used by its neighbors. This never needs more
+    than $t$ colors. For sparse graphs, the $t$-core is often much smaller
+    than the graph itself.
+
+    If the graph is disconnected, the optimization algorithms are applied to
+    each connected component separately, starting with the largest. Because
+    color labels are reused in each component, the number of colors used is
+    the maximum used in any component. Components whose solutions already
+    use no more colors than this are therefore not optimized further. When
+    using local search, the iteration limit is shared between the
+    components. The exception is when local search is run in parallel
+    (``n_jobs`` greater than ``1``): the graph is then optimized as a whole,
+    so that the worker processes are only started once.
+
     If ``opt_alg=2``, the TabuCol algorithm is used. This algorithm is based
     on tabu search and operates by fixing the number of colors but allowing
     clashes to occur (a clash is the occurrence of two adjacent nodes having
     the same color). The aim is to alter the color assignments so that the
     number of clashes is reduced to zero. Each iteration of TabuCol has a
     complexity of $O(nk + m)$, where $k$ is the number of colors currently
-    being used. The process also uses $O(nk + m)$ memory.
+    being used. The process also uses $O(nk + m)$ memory. In this
+    implementation, the number of neighbors that each node has in each color
+    is held in an $n \times k$ NumPy array, so that all moves of the
+    clashing nodes are evaluated using vectorized operations.
 
     If ``opt_alg=3``, the PartialCol algorithm is used. This algorithm is also
     based on tabu search and operates by fixing the number of colors but
     allowing some nodes to be left uncolored. The aim is to make alterations
     to the color assignments so that no uncolored nodes remain. As with
     TabuCol, each iteration of PartialCol has complexity $O(nk +m)$ and uses
-    $O(nk + m)$ memory.
+    $O(nk + m)$ memory. In practice, iterations are much cheaper than this,
+    because the possible moves are held in buckets according to their costs,
+    and only the moves of nodes adjacent to those that change color are
+    updated in each iteration.
+
+    If ``n_jobs`` is greater than one, TabuCol and PartialCol are run in this
+    many worker processes at once. Each worker follows its own randomized
+    trajectory from the same initial solution. As soon as any worker finds a
+    proper solution using $k$ colors, the others abandon their searches with
+    $k$ colors and continue from their current solutions with $k-1$ colors.
+    Each worker is given the full iteration limit, so this will usually
+    produce solutions using fewer colors in the same amount of time.
 
     If ``opt_alg`` is set to ``4`` or ``5``, a hybrid evolutionary algorithm
     (HEA) is used [5]_. This method maintains a small population of $k$-colored
@@ -2071,12 +3849,32 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
     Each iteration of the HEA has complexity $O(nk+m)$, as above. Note that
     the HEA is often able to produce solutions using fewer colors compared to
     when using ``opt_alg=2`` or ``opt_alg=3``; however, larger iteration
-    limits will usually be needed to see these improvements.
+    limits will usually be needed to see these improvements. In this
+    implementation, the recombination operator holds the parents and their
+    color class sizes in NumPy arrays, so that each offspring is produced
+    using $O(n \log n + k^2)$ vectorized operations.
+
+    If ``n_jobs`` is greater than one when using the HEA, an island model is
+    used [7]_. Each of the ``n_jobs`` worker processes evolves its own
+    population (an island), and the islands are arranged in a ring. Every
+    five offspring, each island sends a copy of its best solution to the
+    next island, where it replaces the weakest solution if it is better.
+    All islands move on to $k-1$ colors as soon as any of them finds a
+    proper solution using $k$ colors.
+
+    If ``checkpoint`` is given, the state of the local search is written to
+    this file every ``checkpoint_interval`` seconds. This includes the
+    current number of colors, the best solution, the tabu lists, the HEA
+    population and the state of the random number generator, so that a long
+    run that is interrupted can be continued using ``resume_from``. TabuCol
+    and PartialCol are checkpointed every 100 iterations at most, and the HEA
+    is checkpointed between the production of individuals. The backtracking
+    algorithm is not checkpointed.
 
     As stated above, if ``verbose`` is set to a positive integer, output is
     produced during the execution of the chosen optimization algorithm. If the
     backtracking algorithm is being used, the stated iterations refer to the
-    number of calls to its recursive function. Otherwise, iterations refer to
+    number of node assignments it has made. Otherwise, iterations refer to
     the $O(nk +m)$ processes mentioned above. If no optimization is performed,
     no output is produced.
 
@@ -2104,34 +3902,204 @@ def node_coloring(G, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0):
       Graph Coloring. Journal of Combinatorial Optimization 3, 379–397.
     .. [6] Lewis, R: Graph Colouring Algorithm User Guide
       <https://rhydlewis.eu/gcol/>
+    .. [7] Whitley, D., S. Rana and R. Heckendorn (1999). The Island Model
+      Genetic Algorithm: On Separability, Population Size and Convergence.
+      Journal of Computing and Information Technology 7, 33–47.
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
+    if not isinstance(checkpoint_interval, (int, float)) or (
+        isinstance(checkpoint_interval, bool) or checkpoint_interval <= 0
+    ):
+        raise ValueError(
+            "Error, checkpoint_interval parameter must be a positive number"
+        )
+    chk = None
+    if checkpoint is not None or resume_from is not None:
+        if n_jobs > 1:
+            raise ValueError(
+                "Error, checkpoint and resume_from cannot be used when n_jobs "
+                "is greater than one"
+            )
+        chk = _Checkpoint(checkpoint, checkpoint_interval, resume_from)
+        chk.check(len(G), opt_alg)
+    deadline = _getdeadline(time_limit)
     if len(G) == 0:
         return {}
     elif G.number_of_edges() == 0:
         return {u: 0 for u in G}
-    # Make an initial coloring based on the chosen strategy
-    if strategy == "random":
-        V = list(G)
-        random.shuffle(V)
-        c = _greedy(G, V)
-    elif strategy == "welsh_powell":
-        V = sorted(G, key=G.degree, reverse=True)
-        c = _greedy(G, V)
-    elif strategy == "rlf":
-        c = _rlf(G)
+    # Make an initial coloring based on the chosen strategy, unless a search
+    # is being resumed, in which case the saved initial coloring is used
+    A = _CSRGraph(G)
+    if chk is not None and chk.initial is not None:
+        c = list(chk.initial)
     else:
-        c = _dsatur(G)
+        c = _initialcoloring(A, strategy, deadline)
+        if chk is not None:
+            chk.initial = list(c)
     # If selected, employ the chosen optimisation method
     if opt_alg is None:
-        return c
+        return A.to_labels(c)
+    if opt_alg in [2, 4]:
+        W = _getEdgeWeights(G, None)
+    else:
+        W = _getNodeWeights(G, None)
+    cliqueNum = nx.approximation.large_clique_size(G)
+    c, its = _reducecolors(
+        A, c, cliqueNum, W, opt_alg, it_limit, verbose, deadline, n_jobs, chk
+    )
+    return A.to_labels(c)
+
+
+def iter_node_colorings(G, strategy="dsatur", opt_alg=None, it_limit=0,
+                        verbose=0, time_limit=None, n_jobs=1):
+    r"""Generate node colorings of a graph that use successively fewer colors.
+
+    This is an anytime version of :meth:`node_coloring`. The first coloring is
+    generated as soon as the constructive algorithm chosen by ``strategy`` has
+    completed. Each time the optimization algorithm chosen by ``opt_alg``
+    then finds a proper coloring using fewer colors, this is generated too.
+    The final coloring is the one that would be returned by
+    :meth:`node_coloring` with the same parameters.
+
+    No work is carried out between requests for the next coloring. Hence, if
+    the caller stops iterating (for example, because a coloring with few
+    enough colors has been found), the optimization is abandoned.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The nodes of this graph will be colored.
+
+    strategy : string, optional (default='dsatur')
+        A string specifying the method used to generate the first coloring.
+        The options are the same as those of :meth:`node_coloring`.
+
+    opt_alg : None or int, optional (default=None)
+        An integer specifying the optimization method that will be used to
+        reduce the number of colors. The options are the same as those of
+        :meth:`node_coloring`. If ``None``, only the first coloring is
+        generated.
+
+    it_limit : int, optional (default=0)
+        Number of iterations of the local search procedure. This limit is
+        shared by all the colorings generated. Not applicable when using
+        ``opt_alg=1``.
+
+    verbose : int, optional (default=0)
+        If set to a positive value, information is output during the
+        optimization process. The higher the value, the more information.
+
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        ``'portfolio'`` strategy and the subsequent optimization process.
+        When this limit is reached, no further colorings are generated. If
+        ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
+    Yields
+    ------
+    dict
+        A proper coloring of the nodes of ``G``, in the same format as that
+        returned by :meth:`node_coloring`. Each coloring uses fewer colors
+        than the previous one.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> import gcol
+    >>>
+    >>> G = nx.frucht_graph()
+    >>> for c in gcol.iter_node_colorings(G, opt_alg=1):
+    ...     print(max(c.values()) + 1)
+    4
+    3
+
+    Raises
+    ------
+    NotImplementedError
+        If ``G`` is a directed graph or a multigraph.
+
+        If ``G`` contains any self-loops.
+
+    ValueError
+        If ``strategy`` is not among the supported options.
+
+        If ``opt_alg`` is not among the supported options.
+
+        If ``it_limit`` is not a nonnegative integer.
+
+        If ``verbose`` is not a nonnegative integer.
+
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
+    Notes
+    -----
+    The parameters are checked when this method is called, rather than when
+    the first coloring is requested. The optimization is then carried out in
+    stages. Each stage runs the chosen optimization algorithm with a target
+    of one fewer color than the current coloring, and ends as soon as this
+    target is reached. Colorings are therefore generated as quickly as with
+    :meth:`node_coloring`. The exception is the backtracking algorithm
+    (``opt_alg=1``), which begins each stage with a new search tree and may
+    therefore revisit parts of the search space.
+
+    See Also
+    --------
+    node_coloring
+
+    """
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
+    return _iternodecolorings(G, strategy, opt_alg, it_limit, verbose,
+                              _getdeadline(time_limit), n_jobs)
+
+
+def _iternodecolorings(G, strategy, opt_alg, it_limit, verbose, deadline,
+                       n_jobs):
+    # Generator used by iter_node_colorings. Repeatedly calls _reducecolors
+    # with a target of one fewer color than the current solution, so that
+    # each improvement is passed to the caller as soon as it is found
+    if len(G) == 0:
+        yield {}
+        return
+    elif G.number_of_edges() == 0:
+        yield {u: 0 for u in G}
+        return
+    A = _CSRGraph(G)
+    c = _initialcoloring(A, strategy, deadline)
+    yield A.to_labels(c)
+    if opt_alg is None:
+        return
     if opt_alg in [2, 4]:
         W = _getEdgeWeights(G, None)
     else:
         W = _getNodeWeights(G, None)
     cliqueNum = nx.approximation.large_clique_size(G)
-    return _reducecolors(G, c, cliqueNum, W, opt_alg, it_limit, verbose)
+    totalits = 0
+    while max(c) + 1 > cliqueNum and not _timeup(deadline):
+        if opt_alg != 1 and totalits >= it_limit:
+            break
+        k = max(c) + 1
+        c, its = _reducecolors(
+            A, list(c), k - 1, W, opt_alg, it_limit - totalits, verbose,
+            deadline, n_jobs
+        )
+        totalits += its
+        if max(c) + 1 >= k:
+            # The target could not be reached, so no further improvements
+            # are possible within the limits
+            break
+        yield A.to_labels(c)
 
 
 def chromatic_number(G):
@@ -2206,12 +4174,78 @@ def chromatic_number(G):
     if len(G) == 0:
         return 0
     cliqueNum = nx.approximation.large_clique_size(G)
-    c = _backtrackcol(G, cliqueNum, 0)
-    return max(c.values()) + 1
+    c = _backtrackcol(_CSRGraph(G), cliqueNum, 0)
+    return max(c) + 1
+
+
+def degeneracy(G):
+    r"""Return the degeneracy of the graph ``G``.
+
+    The degeneracy of a graph $G$, denoted by $\delta^*(G)$, is the smallest
+    integer $d$ such that every subgraph of $G$ contains a node with at most
+    $d$ neighbors. Equivalently, it is the largest $d$ for which $G$ has a
+    nonempty $d$-core. Coloring the nodes greedily in smallest-last order
+    never uses more than $\delta^*(G) + 1$ colors, so this value gives an
+    upper bound on the chromatic number: $\chi(G) \leq \delta^*(G) + 1$.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The degeneracy of this graph will be calculated.
+
+    Returns
+    -------
+    int
+        A nonnegative integer that gives the degeneracy of ``G``.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> import gcol
+    >>>
+    >>> G = nx.dodecahedral_graph()
+    >>> print("Degeneracy is", gcol.degeneracy(G))
+    Degeneracy is 3
+
+    Raises
+    ------
+    NotImplementedError
+        If ``G`` is a directed graph or a multigraph.
+
+        If ``G`` contains any self-loops.
+
+    Notes
+    -----
+    The degeneracy is determined by repeatedly removing a node of minimum
+    degree from the graph, as in the ``smallest_last`` strategy of
+    :meth:`node_coloring`. The degeneracy is the largest degree observed at
+    the time of a node's removal. Nodes are held in buckets according to
+    their degrees, so this takes $O(n + m)$ time [1]_.
+
+    See Also
+    --------
+    chromatic_number
+    node_coloring
+
+    References
+    ----------
+    .. [1] Matula, D. and L. Beck (1983). Smallest-last ordering and
+      clustering and graph coloring algorithms. Journal of the ACM 30,
+      417–427.
+
+    """
+    if G.is_directed() or G.is_multigraph() or nx.number_of_selfloops(G) > 0:
+        raise NotImplementedError(
+            "Error, this method cannot be used with directed graphs, "
+            "multigraphs, or graphs containing self-loops."
+        )
+    V, d = _smallestlast(_CSRGraph(G))
+    return d
 
 
 def node_precoloring(
-    G, precol=None, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0
+    G, precol=None, strategy="dsatur", opt_alg=None, it_limit=0, verbose=0,
+    time_limit=None, n_jobs=1
 ):
     r"""Return a coloring of a graph's nodes where some nodes are precolored.
 
@@ -2256,17 +4290,31 @@ def node_precoloring(
           applies the greedy algorithm for graph node coloring [2]_.
         * ``'welsh-powell'`` : Orders the modified graphs nodes by decreasing
           degree, then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the modified graph to form a smallest-last ordering, then
+          applies the greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          modified graph, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           the modified graph [3]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on the modified graph [4]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to the modified graph, running
+          these concurrently for larger graphs. The solution using the fewest
+          colors is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used to
         try to reduce the number of colors. It must be one of the following
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes to have the same color.
           Each iteration has a complexity $O(m + kn)$, where $n$ is the number
@@ -2295,6 +4343,19 @@ def node_precoloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -2311,14 +4372,14 @@ def node_precoloring(
     >>> p = {0:1, 8:0, 9:1}
     >>> c = gcol.node_precoloring(G, precol=p)
     >>> print("Coloring is", c)
-    Coloring is {0: 1, 9: 1, 1: 2, 8: 0, 19: 2, ..., 16: 0}
+    Coloring is {8: 0, 0: 1, 9: 1, 1: 2, 2: 1, ..., 19: 2}
     >>>
     >>> p = {i:i for i in range(5)}
     >>> c = gcol.node_precoloring(
     ...     G, precol=p, strategy="dsatur", opt_alg=2, it_limit=1000
     ... )
     >>> print(c)
-    {0: 0, 4: 4, 1: 1, 2: 2, 3: 3, ..., 12: 2}
+    {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, ..., 19: 4}
 
     Raises
     ------
@@ -2336,6 +4397,10 @@ def node_precoloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``G`` contains a node with the name ``'super'``.
 
         If ``precol`` contains a node that is not in ``G``.
@@ -2377,13 +4442,14 @@ def node_precoloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0:
         return {}
     if precol is None or precol == {}:
         return node_coloring(
             G, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(precol, dict):
         raise TypeError(
@@ -2441,7 +4507,7 @@ def node_precoloring(
     # Now color GPrime. At least k colors will be needed
     cPrime = node_coloring(
         GPrime, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-        verbose=verbose
+        verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
     )
     k = max(cPrime.values()) + 1
     # Make a coloring c of G by replacing the super-nodes by their originals
@@ -2474,7 +4540,9 @@ def node_list_coloring(
     strategy="dsatur",
     opt_alg=None,
     it_limit=0,
-    verbose=0
+    verbose=0,
+    time_limit=None,
+    n_jobs=1
 ):
     r"""Return a solution to the node list coloring problem on ``G``.
 
@@ -2523,16 +4591,30 @@ def node_list_coloring(
           applies the greedy algorithm for graph node coloring [2]_.
         * ``'welsh-powell'`` : Orders the modified graphs nodes by decreasing
           degree, then applies the greedy algorithm.
+        * ``'smallest_last'`` : Repeatedly removes a node of minimum degree
+          from the modified graph to form a smallest-last ordering, then
+          applies the greedy algorithm to the reverse of this ordering.
+        * ``'jones_plassmann'`` : Gives random priorities to the nodes of the
+          modified graph, then colors them in a series of rounds using the
+          Jones-Plassmann algorithm. Each round is carried out using vectorized
+          operations.
         * ``'dsatur'`` : Uses the DSatur algorithm for graph node coloring on
           the modified graph [3]_.
         * ``'rlf'`` : Uses the recursive largest first (RLF) algorithm for
           graph node coloring on the modified graph [4]_.
+        * ``'portfolio'`` : Applies the ``'smallest_last'``, ``'random'``
+          (using three different random orderings), ``'welsh_powell'``,
+          ``'dsatur'``, and ``'rlf'`` strategies to the modified graph, running
+          these concurrently for larger graphs. The solution using the fewest
+          colors is returned.
 
     opt_alg : None or int, optional (default=None)
         An integer specifying the optimization method that will be used.
 
         * ``1`` : An exact, exponential-time algorithm based on backtracking.
-          The algorithm halts only when an optimal solution has been found.
+          The algorithm halts only when an optimal solution has been found,
+          or when ``time_limit`` expires (returning the best solution
+          found).
         * ``2`` : A local search algorithm that seeks to reduce the number of
           colors by temporarily allowing adjacent nodes to have the same color.
           Each iteration has a complexity $O(m + kn)$, where $n$ is the number
@@ -2561,6 +4643,19 @@ def node_list_coloring(
         If set to a positive value, information is output during the
         optimization process. The higher the value, the more information.
 
+    time_limit : None or float, optional (default=None)
+        A limit, in seconds, on the wall-clock time taken by the
+        optimization process. When this limit is reached, the search halts
+        and the best solution found so far is used, even if ``it_limit`` has
+        not been reached. If ``None``, no limit is applied.
+
+    n_jobs : int, optional (default=1)
+        The number of worker processes used by the local search algorithms
+        (``opt_alg`` set to ``2``, ``3``, ``4`` or ``5``). If greater than
+        one, this many searches are run in parallel, each with its own
+        iteration limit. For the HEA, each process evolves its own
+        population. It has no effect on the backtracking algorithm.
+
     Returns
     -------
     dict
@@ -2577,7 +4672,7 @@ def node_list_coloring(
     >>> V = {0: [0, 1], 1: [1], 2: [0, 3], 3: [0, 1, 3]}
     >>> c = gcol.node_list_coloring(G, V)
     >>> print(c)
-    {1: 1, 0: 0, 2: 3, 3: 1}
+    {0: 0, 1: 1, 2: 3, 3: 1}
 
     Raises
     ------
@@ -2595,6 +4690,10 @@ def node_list_coloring(
 
         If ``verbose`` is not a nonnegative integer.
 
+        If ``time_limit`` is not ``None`` or a nonnegative number.
+
+        If ``n_jobs`` is not a positive integer.
+
         If ``G`` contains a node with the name ``'dummy'``.
 
         If ``allowed_cols`` has a node not in G, or is missing an entry for a
@@ -2643,13 +4742,14 @@ def node_list_coloring(
       <https://rhydlewis.eu/gcol/>
 
     """
-    _check_params(G, strategy, opt_alg, it_limit, verbose)
+    _check_params(G, strategy, opt_alg, it_limit, verbose, time_limit,
+                  n_jobs)
     if len(G) == 0:
         return {}
     if allowed_cols is None or len(allowed_cols) == 0:
         return node_coloring(
             G, strategy=strategy, opt_alg=opt_alg, it_limit=it_limit,
-            verbose=verbose
+            verbose=verbose, time_limit=time_limit, n_jobs=n_jobs
         )
     if not isinstance(allowed_cols, dict):
         raise TypeError(
@@ -2705,7 +4805,8 @@ def node_list_coloring(
             if i not in L[u]:
                 G.add_edge(u, ("dummy", i))
     c = node_k_coloring(
-        G, len(allCols), opt_alg=opt_alg, it_limit=it_limit, verbose=verbose
+        G, len(allCols), opt_alg=opt_alg, it_limit=it_limit, verbose=verbose,
+        time_limit=time_limit, n_jobs=n_jobs
     )
     # Apply a color relabeling and delete the dummy nodes (any node with the
     # same color as ("dummy", i) should receive color i
@@ -2723,6 +4824,7 @@ def node_list_coloring(
 equitable_node_k_colouring = equitable_node_k_coloring
 min_cost_k_colouring = min_cost_k_coloring
 node_colouring = node_coloring
+iter_node_colourings = iter_node_colorings
 node_k_colouring = node_k_coloring
 node_precolouring = node_precoloring
 node_list_colouring = node_list_coloring
@@ -21,7 +21,7 @@ setup(
         'Operating System :: OS Independent',
         ],
     python_requires='>=3.7',
-    install_requires=['networkx>=3.0', 'matplotlib>=3.8', 'heapdict>=1.0.1'],
+    install_requires=['networkx>=3.0', 'matplotlib>=3.8', 'numpy'],
     extras_require = {
         'testing': ["pytest"],
         'documentation': ["pandas"],
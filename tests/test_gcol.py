@@ -1,11 +1,14 @@
 """Greedy coloring test suite."""
 import pytest
+import time
+import itertools
 import networkx as nx
 from collections import defaultdict
 import gcol
 
 
-GREEDY_METHODS = ["random", "welsh_powell", "dsatur", "rlf"]
+GREEDY_METHODS = ["random", "welsh_powell", "smallest_last", "jones_plassmann",
+                  "dsatur", "rlf"]
 OPT_ALGS = [1, 2, 3, 4, 5, None]
 IT_LIMITS = [0, 100, 1000]
 VERBOSE = [0, 1, 2]
@@ -97,6 +100,17 @@ class TestColorings:
         graph = singleton()
         pytest.raises(ValueError, gcol.node_coloring, graph, verbose=-1)
 
+    def test_negative_time_limit_parameter(self):
+        graph = singleton()
+        pytest.raises(ValueError, gcol.node_coloring, graph, time_limit=-1)
+
+    def test_bool_parameters(self):
+        graph = singleton()
+        for param in ["it_limit", "verbose", "time_limit", "n_jobs"]:
+            pytest.raises(
+                ValueError, gcol.node_coloring, graph, **{param: True}
+            )
+
     def test_directed_graph(self):
         graph = nx.erdos_renyi_graph(10, 0.5, directed=True)
         pytest.raises(NotImplementedError, gcol.node_coloring, graph)
@@ -112,6 +126,149 @@ class TestColorings:
         graph.add_edge(0, 0)
         pytest.raises(NotImplementedError, gcol.node_coloring, graph)
 
+    def test_dsatur_bipartite(self):
+        # DSatur is exact for bipartite graphs
+        for graph in [complete_bipartite(), grid(), nx.cycle_graph(50),
+                      nx.balanced_tree(2, 6)]:
+            c = gcol.node_coloring(graph, strategy="dsatur")
+            assert verify_node_coloring(graph, c)
+            assert get_num_cols(c) == 2
+
+    def test_rlf_bipartite(self):
+        # RLF is also exact for bipartite graphs
+        for graph in [complete_bipartite(), grid(), nx.cycle_graph(50),
+                      nx.balanced_tree(2, 6)]:
+            c = gcol.node_coloring(graph, strategy="rlf")
+            assert verify_node_coloring(graph, c)
+            assert get_num_cols(c) == 2
+
+    def test_dense(self):
+        # Dense graphs are colored using the adjacency matrix as bitsets
+        for p in [0.1, 0.3, 0.5]:
+            graph = nx.gnp_random_graph(60, p, seed=3)
+            for strategy in GREEDY_METHODS:
+                c = gcol.node_coloring(graph, strategy=strategy)
+                assert verify_node_coloring(graph, c)
+
+    def test_smallest_last_bound(self):
+        # Smallest-last never uses more than degeneracy + 1 colors
+        for graph in [nx.gnp_random_graph(200, 0.03, seed=1), grid(),
+                      nx.barabasi_albert_graph(300, 3, seed=1),
+                      nx.gnp_random_graph(60, 0.3, seed=3)]:
+            d = max(nx.core_number(graph).values())
+            assert gcol.degeneracy(graph) == d
+            c = gcol.node_coloring(graph, strategy="smallest_last")
+            assert verify_node_coloring(graph, c)
+            assert get_num_cols(c) <= d + 1
+        assert gcol.degeneracy(nx.Graph()) == 0
+
+    def test_jones_plassmann(self):
+        # Graphs with many colors and isolated nodes
+        for graph in [nx.complete_graph(150), nx.empty_graph(10),
+                      nx.gnp_random_graph(300, 0.02, seed=4),
+                      nx.gnp_random_graph(300, 0.9, seed=4)]:
+            graph.add_nodes_from(["a", "b"])
+            c = gcol.node_coloring(graph, strategy="jones_plassmann")
+            assert len(c) == len(graph)
+            for u, v in graph.edges():
+                assert c[u] != c[v]
+
+    def test_portfolio(self):
+        # The portfolio is at least as good as its deterministic members, both
+        # when run in turn (small graphs) and in separate processes
+        for graph in [nx.gnp_random_graph(50, 0.2, seed=5),
+                      nx.gnp_random_graph(1000, 0.025, seed=5)]:
+            c = gcol.node_coloring(graph, strategy="portfolio")
+            assert verify_node_coloring(graph, c)
+            for strategy in ["welsh_powell", "dsatur", "rlf"]:
+                c2 = gcol.node_coloring(graph, strategy=strategy)
+                assert get_num_cols(c) <= get_num_cols(c2)
+            c = gcol.node_coloring(graph, strategy="portfolio", time_limit=0)
+            assert verify_node_coloring(graph, c)
+
+    def test_time_limit(self):
+        # A short time limit halts the optimizers long before the iteration
+        # limit, but a valid solution is still returned
+        graph = nx.gnp_random_graph(100, 0.2, seed=6)
+        for opt_alg in OPT_ALGS:
+            start = time.monotonic()
+            c = gcol.node_coloring(
+                graph, opt_alg=opt_alg, it_limit=10 ** 9, time_limit=0.5
+            )
+            assert time.monotonic() - start < 10
+            assert verify_node_coloring(graph, c)
+        start = time.monotonic()
+        S = gcol.max_independent_set(graph, it_limit=10 ** 9, time_limit=0.5)
+        assert time.monotonic() - start < 10
+        assert all(not graph.has_edge(u, v) for u in S for v in S)
+        c = gcol.min_cost_k_coloring(
+            graph, 5, weights_at="edges", it_limit=10 ** 9, time_limit=0.5
+        )
+        assert len(c) == len(graph)
+
+    def test_iter_node_colorings(self):
+        # Each generated coloring is proper and uses fewer colors than the
+        # last, and the final one matches the chromatic number when
+        # backtracking is used
+        for graph_func in TEST_CASES:
+            G = graph_func()
+            for opt_alg in OPT_ALGS:
+                last = None
+                for c in gcol.iter_node_colorings(G, opt_alg=opt_alg,
+                                                  it_limit=1000):
+                    assert verify_node_coloring(G, c)
+                    if last is not None:
+                        assert get_num_cols(c) < last
+                    last = get_num_cols(c)
+                if opt_alg == 1:
+                    assert last == gcol.chromatic_number(G)
+        # Parameters are checked when the method is called
+        pytest.raises(ValueError, gcol.iter_node_colorings, singleton(),
+                      it_limit=-1)
+
+    def test_n_jobs(self):
+        # Parallel local search and island HEA, including on a disconnected
+        # graph. The parallel searches start from the same DSatur solution,
+        # so they never use more colors than this
+        graph = nx.gnp_random_graph(80, 0.3, seed=7)
+        graph = nx.disjoint_union(graph, nx.gnp_random_graph(30, 0.5, seed=7))
+        initial = get_num_cols(gcol.node_coloring(graph))
+        for opt_alg in [2, 3, 4, 5]:
+            c = gcol.node_coloring(
+                graph, opt_alg=opt_alg, it_limit=2000, n_jobs=2
+            )
+            assert verify_node_coloring(graph, c)
+            assert get_num_cols(c) < initial
+        c = gcol.node_k_coloring(graph, 12, opt_alg=2, it_limit=10000,
+                                 n_jobs=2)
+        assert verify_node_coloring(graph, c)
+        pytest.raises(ValueError, gcol.node_coloring, graph, n_jobs=0)
+
+    def test_checkpoint(self, tmp_path):
+        # Resuming from the last checkpoint of a search reproduces its result,
+        # including on a disconnected graph
+        graph = nx.gnp_random_graph(60, 0.3, seed=8)
+        graph = nx.disjoint_union(graph, nx.gnp_random_graph(20, 0.5, seed=8))
+        for opt_alg in [2, 3, 4, 5]:
+            f = str(tmp_path / ("chk" + str(opt_alg)))
+            c = gcol.node_coloring(
+                graph, opt_alg=opt_alg, it_limit=5000, checkpoint=f,
+                checkpoint_interval=1e-9
+            )
+            c2 = gcol.node_coloring(
+                graph, opt_alg=opt_alg, it_limit=5000, resume_from=f
+            )
+            assert verify_node_coloring(graph, c)
+            assert c == c2
+        pytest.raises(ValueError, gcol.node_coloring, graph, opt_alg=3,
+                      resume_from=f)
+        pytest.raises(ValueError, gcol.node_coloring, graph, checkpoint=f,
+                      n_jobs=2)
+        pytest.raises(ValueError, gcol.node_coloring, graph,
+                      checkpoint_interval=0)
+        pytest.raises(ValueError, gcol.node_coloring, graph,
+                      checkpoint_interval=True)
+
 
 class TestChromatics:
     def test_many_chromatic_number(self):
@@ -127,6 +284,52 @@ class TestChromatics:
             delta = get_max_degree(G)
             assert chi == delta or chi == delta + 1
 
+    def test_disconnected(self):
+        # Components are colored separately, reusing the same color labels
+        G = nx.gnp_random_graph(40, 0.2, seed=2)
+        for i in range(50):
+            G = nx.disjoint_union(G, nx.gnp_random_graph(8, 0.5, seed=i))
+        chi = max(gcol.chromatic_number(G.subgraph(V))
+                  for V in nx.connected_components(G))
+        assert gcol.chromatic_number(G) == chi
+        for opt_alg in OPT_ALGS:
+            c = gcol.node_coloring(G, opt_alg=opt_alg, it_limit=1000)
+            assert verify_node_coloring(G, c)
+            if opt_alg == 1:
+                assert get_num_cols(c) == chi
+
+    def test_deep_search(self):
+        # The backtracking search is iterative, so it is not limited by the
+        # recursion depth on large graphs
+        assert gcol.chromatic_number(nx.cycle_graph(5001)) == 3
+        G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(50, 50))
+        G.add_edges_from([(0, 51), (1, 50)])
+        c = gcol.node_coloring(G, opt_alg=1)
+        assert verify_node_coloring(G, c)
+        assert get_num_cols(c) == 4
+
+    def test_exact_dense(self):
+        # Graphs whose largest cliques are smaller than their chromatic
+        # numbers, so that the search must prove optimality
+        assert gcol.chromatic_number(nx.mycielski_graph(5)) == 5
+        assert gcol.chromatic_number(nx.complement(nx.cycle_graph(7))) == 4
+        G = nx.gnp_random_graph(45, 0.5, seed=4)
+        c = gcol.node_coloring(G, opt_alg=1)
+        assert verify_node_coloring(G, c)
+        assert get_num_cols(c) == 9
+
+    def test_warm_start(self):
+        # The exact algorithm starts from a heuristic solution, so even when
+        # it is stopped at once, it returns a proper coloring that is no
+        # worse than the initial one
+        G = nx.gnp_random_graph(70, 0.5, seed=5)
+        for strategy in GREEDY_METHODS:
+            c = gcol.node_coloring(G, strategy=strategy, opt_alg=1,
+                                   time_limit=0)
+            assert verify_node_coloring(G, c)
+            assert get_num_cols(c) <= get_num_cols(
+                gcol.node_coloring(G, strategy="dsatur"))
+
 
 class TestNodePrecolorings:
     def test_many(self):
@@ -446,6 +649,74 @@ class TestKColourings:
             gcol.equitable_edge_k_coloring, graph, 3, weight="weight"
         )
 
+    def test_small_core(self):
+        # Nodes outside of the k-core are colored after optimization
+        G = nx.gnp_random_graph(40, 0.2, seed=2)
+        T = nx.barabasi_albert_graph(500, 2, seed=1)
+        G = nx.union(G, nx.relabel_nodes(T, lambda u: u + 1000))
+        G.add_edges_from((u % 40, u + 1000) for u in range(0, 500, 10))
+        k = gcol.chromatic_number(nx.k_core(G, 3))
+        for opt_alg in [1, 2, 3, 4, 5]:
+            c = gcol.node_k_coloring(G, k, opt_alg=opt_alg, it_limit=20000)
+            assert verify_node_coloring(G, c)
+            assert get_num_cols(c) <= k
+            c = gcol.equitable_node_k_coloring(
+                G, k, opt_alg=opt_alg, it_limit=20000
+            )
+            assert verify_node_coloring(G, c)
+            assert get_num_cols(c) <= k
+
+    def test_equitable_large(self):
+        # Balancing a large weighted graph via incrementally evaluated moves
+        G = nx.gnp_random_graph(2000, 0.004, seed=5)
+        for v in G:
+            G.nodes[v]["weight"] = 1 + v % 17
+        k = 10
+        c = gcol.equitable_node_k_coloring(G, k, weight="weight")
+        assert verify_node_coloring(G, c)
+        assert get_num_cols(c) <= k
+        C = [0] * k
+        for v in G:
+            C[c[v]] += G.nodes[v]["weight"]
+        assert max(C) - min(C) <= 2
+
+    def test_equitable_tabu(self, capsys):
+        G = nx.gnp_random_graph(60, 0.3, seed=1)
+        for v in G:
+            G.nodes[v]["weight"] = 1 + (7 * v) % 50
+        k = 12
+        c = gcol.equitable_node_k_coloring(
+            G, k, weight="weight", it_limit=500, verbose=1, eq_alg=2
+        )
+        assert verify_node_coloring(G, c)
+        assert get_num_cols(c) <= k
+        # No improvement is reported after the iteration limit
+        out = capsys.readouterr().out.split("\n")
+        its = [int(line.split()[-1]) for line in out
+               if line.startswith("    Found solution with cost")]
+        assert len(its) > 0 and max(its) <= 500
+        G = dodec()
+        c = gcol.equitable_edge_k_coloring(G, 4, it_limit=100, eq_alg=2)
+        assert verify_edge_coloring(G, c)
+        c = gcol.equitable_face_k_coloring(
+            G, nx.planar_layout(G), 4, opt_alg=2, it_limit=100, eq_alg=2
+        )
+        assert get_num_cols(c) <= 4
+
+    def test_bad_eq_alg(self):
+        graph = dodec()
+        pytest.raises(
+            ValueError, gcol.equitable_node_k_coloring, graph, 3, eq_alg=3
+        )
+        pytest.raises(
+            ValueError, gcol.equitable_edge_k_coloring, graph, 3, eq_alg=0
+        )
+        pytest.raises(
+            ValueError,
+            gcol.equitable_face_k_coloring,
+            graph, nx.planar_layout(graph), 4, eq_alg=None
+        )
+
 
 class TestMaxIS:
     def test_many(self):
@@ -455,6 +726,54 @@ class TestMaxIS:
                 S = gcol.max_independent_set(G, weight=None, it_limit=it_limit)
                 assert verify_independent_set(G, S)
 
+    def test_ils(self):
+        for graph_func in TEST_CASES:
+            G = graph_func()
+            for it_limit in IT_LIMITS:
+                S = gcol.max_independent_set(G, it_limit=it_limit, mis_alg=2)
+                assert verify_independent_set(G, S)
+        G = nx.gnp_random_graph(200, 0.05, seed=4)
+        for v in G:
+            G.nodes[v]["weight"] = 1 + v % 9
+        S = gcol.max_independent_set(
+            G, weight="weight", it_limit=1000, mis_alg=2
+        )
+        assert verify_independent_set(G, S)
+        G = dodec()
+        S = gcol.max_independent_set(G, it_limit=1000, mis_alg=2)
+        assert verify_independent_set(G, S) and len(S) == 8
+
+    def test_bad_mis_alg(self):
+        graph = dodec()
+        pytest.raises(ValueError, gcol.max_independent_set, graph, mis_alg=3)
+
+    def test_reductions(self):
+        # Forests, paths and cycles are solved by the reduction rules alone
+        G = nx.cycle_graph(101)
+        S = gcol.max_independent_set(G)
+        assert verify_independent_set(G, S) and len(S) == 50
+        G = nx.path_graph(100)
+        S = gcol.max_independent_set(G)
+        assert verify_independent_set(G, S) and len(S) == 50
+        G = nx.star_graph(5)
+        G.add_nodes_from(G, weight=1)
+        G.nodes[0]["weight"] = 6
+        assert gcol.max_independent_set(G, weight="weight") == [0]
+        G = nx.barabasi_albert_graph(300, 1, seed=3)
+        for v in G:
+            G.nodes[v]["weight"] = 1 + (v * 37) % 11
+        S = gcol.max_independent_set(G, weight="weight")
+        assert verify_independent_set(G, S)
+        # Compare with the optimum, found by dynamic programming on the tree
+        best = {}
+        for v in reversed(list(nx.dfs_preorder_nodes(G, 0))):
+            C = [u for u in G[v] if u in best]
+            best[v] = (
+                G.nodes[v]["weight"] + sum(best[u][1] for u in C),
+                sum(max(best[u]) for u in C),
+            )
+        assert sum(G.nodes[v]["weight"] for v in S) == max(best[0])
+
 
 class TestMinCostKColoring:
     def test_many(self):
@@ -517,6 +836,59 @@ class TestMinCostKColoring:
                             it_limit=it_limit
                         )
 
+    def test_node_weight_values(self):
+        # PartialCol with fractional node weights. On these small graphs the
+        # long runs force the aspiration criterion and the all-tabu fallback
+        # to be used. Optimal costs are found by brute force
+        for seed in range(4):
+            G = nx.gnp_random_graph(7, 0.5, seed=seed)
+            for u in G:
+                G.nodes[u]["weight"] = [0.5, 1.25, 2.0, 3.75][u % 4]
+            for k in [1, 2, 3]:
+                c = gcol.min_cost_k_coloring(
+                    G, k, weight="weight", weights_at="nodes", it_limit=2000
+                )
+                assert all(c[u] == -1 or c[u] != c[v] for u, v in G.edges())
+                best = min(
+                    uncolored_weight(G, dict(enumerate(cols)))
+                    for cols in itertools.product(range(-1, k), repeat=7)
+                    if all(cols[u] == -1 or cols[u] != cols[v]
+                           for u, v in G.edges())
+                )
+                assert uncolored_weight(G, c) == best
+            S = gcol.max_independent_set(G, weight="weight", it_limit=2000)
+            assert verify_independent_set(G, S)
+            best = max(
+                sum(G.nodes[u]["weight"] for u in S)
+                for r in range(len(G) + 1)
+                for S in itertools.combinations(G, r)
+                if not any(G.has_edge(u, v) for u, v in
+                           itertools.combinations(S, 2))
+            )
+            assert sum(G.nodes[u]["weight"] for u in S) == best
+
+    def test_edge_weight_values(self):
+        # Large integer weights must not overflow, and fractional weights
+        # must not be rounded. Optimal costs are found by brute force
+        for weights in [[2 ** 30], [10 ** 10, 3], [10 ** 19, 10 ** 19 + 1],
+                        [0.5, 1.25, 2.0]]:
+            for seed in range(3):
+                G = nx.gnp_random_graph(7, 0.7, seed=seed)
+                for i, (u, v) in enumerate(G.edges()):
+                    G[u][v]["weight"] = weights[i % len(weights)]
+                for k in [2, 3]:
+                    c = gcol.min_cost_k_coloring(
+                        G, k, weight="weight", weights_at="edges",
+                        it_limit=1000
+                    )
+                    assert len(c) == len(G)
+                    assert set(c.values()) <= set(range(k))
+                    best = min(
+                        clash_weight(G, dict(enumerate(cols)))
+                        for cols in itertools.product(range(k), repeat=7)
+                    )
+                    assert clash_weight(G, c) == best
+
     def test_bad_node_weights(self):
         graph = nx.Graph()
         graph.add_nodes_from([0, 1, 2], weight=-5)
@@ -1149,6 +1521,14 @@ def get_max_degree(G):
     return max(G.degree(node) for node in G.nodes) if len(G.nodes) > 0 else 0
 
 
+def clash_weight(G, c):
+    return sum(G[u][v]["weight"] for u, v in G.edges() if c[u] == c[v])
+
+
+def uncolored_weight(G, c):
+    return sum(G.nodes[u]["weight"] for u in G if c[u] == -1)
+
+
 def get_num_cols(c):
     if len(c) == 0:
         return 0